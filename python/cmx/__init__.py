@@ -1,6 +1,6 @@
 """CMX Python package -- programmatic access to the CMX parameter store."""
 
-from .client import CmxClient
+from .client import CmxClient, Pipeline
 from .decorators import when, rules, get_registered_decorators, get_registered_rules
 from .watch import WatchManager
 
@@ -9,6 +9,8 @@ _default_client: CmxClient = None
 
 
 def _get_client() -> CmxClient:
+    # Slow path only; the wrappers below read _default_client directly
+    # and call this just for the first use.
     global _default_client
     if _default_client is None:
         _default_client = CmxClient()
@@ -17,22 +19,22 @@ def _get_client() -> CmxClient:
 
 def get(path: str):
     """GET a value from the parameter store."""
-    return _get_client().get(path)
+    return (_default_client or _get_client()).get(path)
 
 
 def set(path: str, value):
     """SET a value in the parameter store."""
-    return _get_client().set(path, value)
+    return (_default_client or _get_client()).set(path, value)
 
 
 def append(path: str, value):
     """APPEND a value in the parameter store."""
-    return _get_client().append(path, value)
+    return (_default_client or _get_client()).append(path, value)
 
 
 def keys(pattern: str = None):
     """List keys matching a pattern."""
-    return _get_client().keys(pattern)
+    return (_default_client or _get_client()).keys(pattern)
 
 
 def watch(pattern: str, callback):
@@ -50,7 +52,7 @@ def connect(socket_path: str = None) -> CmxClient:
 
 
 __all__ = [
-    'CmxClient', 'WatchManager',
+    'CmxClient', 'Pipeline', 'WatchManager',
     'when', 'rules',
     'get', 'set', 'append', 'keys', 'watch', 'connect',
     'get_registered_decorators', 'get_registered_rules',
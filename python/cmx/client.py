@@ -1,9 +1,121 @@
 """CMX client -- typed access to the parameter store."""
 
-from typing import Any, Optional, List
+from typing import Any, Callable, Optional, List
 from .protocol import SocketConnection
 
 
+def _check_response(resp: dict) -> dict:
+    """Raise KeyError/RuntimeError for an error response, else return it."""
+    if resp.get("status") == "error":
+        msg = resp.get("message", "Unknown error")
+        if "not found" in msg.lower() or "NotFound" in msg:
+            raise KeyError(msg)
+        raise RuntimeError(msg)
+    return resp
+
+
+def _keys_output(resp: dict) -> List[str]:
+    output = resp.get("output", "")
+    if not output:
+        return []
+    return output.split("\n")
+
+
+def _keys_command(pattern: Optional[str]) -> dict:
+    cmd = {"command": "ns.keys"}
+    if pattern is not None:
+        cmd["pattern"] = pattern
+    return cmd
+
+
+class PipelineResult:
+    """Deferred result of a command queued on a Pipeline.
+
+    Resolved when the pipeline executes. ``result()`` returns the typed
+    value or raises the command's error (KeyError / RuntimeError).
+    """
+
+    __slots__ = ("_transform", "_resp")
+
+    def __init__(self, transform: Callable[[dict], Any]):
+        self._transform = transform
+        self._resp: Optional[dict] = None
+
+    def done(self) -> bool:
+        """True once the pipeline has executed."""
+        return self._resp is not None
+
+    def result(self) -> Any:
+        """Return the command's value, raising its error if it failed."""
+        if self._resp is None:
+            raise RuntimeError("Pipeline has not been executed")
+        return self._transform(_check_response(self._resp))
+
+
+class Pipeline:
+    """Queues commands and sends them to the daemon in a single batch.
+
+    Usage:
+        with client.pipeline() as p:
+            status = p.get("agent.w1.status")
+            p.set("task.t1.status", "complete")
+        status.result()
+
+    Commands are sent when the ``with`` block exits (or on ``execute()``).
+    """
+
+    def __init__(self, client: 'CmxClient'):
+        self._client = client
+        self._commands: List[dict] = []
+        self._results: List[PipelineResult] = []
+
+    def _queue(self, command: dict, transform: Callable[[dict], Any]) -> PipelineResult:
+        pending = PipelineResult(transform)
+        self._commands.append(command)
+        self._results.append(pending)
+        return pending
+
+    def get(self, path: str) -> PipelineResult:
+        """Queue a GET."""
+        return self._queue({"command": "ns.get", "path": path},
+                           lambda r: r.get("output"))
+
+    def set(self, path: str, value: Any) -> PipelineResult:
+        """Queue a SET."""
+        return self._queue({"command": "ns.set", "path": path, "value": value},
+                           lambda r: None)
+
+    def append(self, path: str, value: Any) -> PipelineResult:
+        """Queue an APPEND."""
+        return self._queue({"command": "ns.append", "path": path, "value": value},
+                           lambda r: None)
+
+    def keys(self, pattern: str = None) -> PipelineResult:
+        """Queue a KEYS listing."""
+        return self._queue(_keys_command(pattern), _keys_output)
+
+    def delete(self, path: str) -> PipelineResult:
+        """Queue a DELETE."""
+        return self._queue({"command": "ns.delete", "path": path},
+                           lambda r: None)
+
+    def execute(self) -> List[PipelineResult]:
+        """Send all queued commands and resolve their results."""
+        commands, results = self._commands, self._results
+        self._commands, self._results = [], []
+        responses = self._client.bulk(commands)
+        for pending, resp in zip(results, responses):
+            pending._resp = resp
+        return results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.execute()
+
+
 class CmxClient:
     """Client for the CMX parameter store.
 
@@ -17,13 +129,20 @@ class CmxClient:
 
     def _send(self, command: dict) -> dict:
         """Send a command and return the raw response dict."""
-        resp = self._conn.send(command)
-        if resp.get("status") == "error":
-            msg = resp.get("message", "Unknown error")
-            if "not found" in msg.lower() or "NotFound" in msg:
-                raise KeyError(msg)
-            raise RuntimeError(msg)
-        return resp
+        return _check_response(self._conn.send(command))
+
+    def bulk(self, commands: List[dict]) -> List[dict]:
+        """Send many commands in one round trip.
+
+        Returns the raw response dicts in request order. Errors are not
+        raised here; inspect each response's ``status`` (or use
+        ``pipeline()`` for per-command typed results).
+        """
+        return self._conn.send_many(list(commands))
+
+    def pipeline(self) -> Pipeline:
+        """Return a Pipeline that batches commands into one round trip."""
+        return Pipeline(self)
 
     def get(self, path: str) -> Any:
         """GET a value from the parameter store.
@@ -45,14 +164,7 @@ class CmxClient:
 
     def keys(self, pattern: str = None) -> List[str]:
         """List keys matching a pattern (or all keys)."""
-        cmd = {"command": "ns.keys"}
-        if pattern is not None:
-            cmd["pattern"] = pattern
-        resp = self._send(cmd)
-        output = resp.get("output", "")
-        if not output:
-            return []
-        return output.split("\n")
+        return _keys_output(self._send(_keys_command(pattern)))
 
     def delete(self, path: str) -> None:
         """Remove a value from the parameter store."""
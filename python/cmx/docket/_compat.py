@@ -0,0 +1,9 @@
+"""Python-version shims shared by the docket modules."""
+
+from __future__ import annotations
+
+import sys
+
+# ``@dataclass(**DATACLASS_SLOTS)`` gives slotted dataclasses on Python 3.10+
+# and falls back to regular dataclasses on 3.9, which lacks ``slots=``.
+DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
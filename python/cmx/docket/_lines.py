@@ -0,0 +1,86 @@
+"""Line iteration over markdown text without materializing line lists.
+
+All helpers honour the same line boundaries as ``str.splitlines()``. Text
+that only uses newlines is walked by offset; anything containing another
+boundary character takes the ``splitlines()`` path so results never differ.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterator
+
+# Line boundaries str.splitlines() honours besides "\n".
+OTHER_LINE_BREAK_RE = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+# A whole line whose first non-blank character is "#" (candidate markdown
+# heading). Only meaningful on text that uses "\n" line breaks exclusively.
+HEADING_LINE_RE = re.compile(r"^[^\S\n]*#.*", re.MULTILINE)
+
+
+def has_other_line_break(text: str) -> bool:
+    """Whether ``text`` has a splitlines() boundary other than ``"\\n"``.
+
+    Each ``in`` test is a C-level memchr-style scan, far faster on long
+    text than searching with the character-class regex.
+    """
+    return (
+        "\r" in text or "\x0b" in text or "\x0c" in text
+        or "\x1c" in text or "\x1d" in text or "\x1e" in text
+        or "\x85" in text or "\u2028" in text or "\u2029" in text
+    )
+
+
+def normalize_newlines(text: str) -> str:
+    """Rewrite every splitlines() boundary in ``text`` as ``"\\n"``.
+
+    Text that already only uses ``"\\n"`` is returned unchanged.
+    """
+    if not has_other_line_break(text):
+        return text
+    ends_with_break = text[-1] == "\n" or OTHER_LINE_BREAK_RE.match(text, len(text) - 1)
+    return "\n".join(text.splitlines()) + ("\n" if ends_with_break else "")
+
+
+def iter_lines(text: str) -> Iterator[str]:
+    """Yield the lines of ``text`` exactly as ``text.splitlines()`` would."""
+    if has_other_line_break(text):
+        yield from text.splitlines()
+        return
+
+    find = text.find
+    n = len(text)
+    pos = 0
+    while pos < n:
+        end = find("\n", pos)
+        if end < 0:
+            end = n
+        yield text[pos:end]
+        pos = end + 1
+
+
+def lines_with_hint(text: str, hint_re: re.Pattern[str]) -> Iterator[str]:
+    """Yield, in order, the lines of ``text`` that contain a ``hint_re`` match.
+
+    Lines without a hint are skipped by the compiled search rather than
+    visited one by one.
+    """
+    if has_other_line_break(text):
+        for line in text.splitlines():
+            if hint_re.search(line) is not None:
+                yield line
+        return
+
+    search = hint_re.search
+    n = len(text)
+    pos = 0
+    while True:
+        m = search(text, pos)
+        if m is None:
+            return
+        start = text.rfind("\n", 0, m.start()) + 1
+        end = text.find("\n", m.end())
+        if end < 0:
+            end = n
+        yield text[start:end]
+        pos = end + 1
@@ -0,0 +1,158 @@
+"""YAML loading for docket frontmatter and kv-frontmatter blocks.
+
+Small ``key: value`` documents are handled without PyYAML; everything else
+goes through the libyaml-backed safe loader when available. PyYAML itself
+is only imported once a document needs it.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+# Fast-path frontmatter line: ``key: value`` at top level. The value must be
+# a plain word-like scalar that YAML would load as a string unchanged.
+_SIMPLE_LINE_RE = re.compile(
+    r"([A-Za-z_][A-Za-z0-9_-]*):(?:[ ]+([A-Za-z][A-Za-z0-9_./-]*(?:[ ]+[A-Za-z0-9_./-]+)*))?[ ]*"
+)
+
+# Indented ``key: [flow, list]`` line inside a one-level block mapping.
+_NESTED_LINE_RE = re.compile(r"( +)([A-Za-z_][A-Za-z0-9_-]*):[ ]+(\[.*\])[ ]*")
+
+# Flow-list item: a double-quoted string without escapes or characters YAML
+# would reject, or a plain word. Neither can contain "," or "]".
+_FLOW_ITEM = '"[^"\\\\\x00-\x1f\x7f-\x9f\ud800-\udfff\ufffe\uffff]*"|[A-Za-z][A-Za-z0-9_./-]*'
+_FLOW_ITEM_RE = re.compile(_FLOW_ITEM)
+_FLOW_LIST_RE = re.compile(
+    rf"\[[ ]*(?:(?:{_FLOW_ITEM})(?:[ ]*,[ ]*(?:{_FLOW_ITEM}))*[ ]*)?\]"
+)
+
+# Characters PyYAML's reader refuses anywhere in a document, comments included.
+_NON_PRINTABLE_RE = re.compile(
+    "[^\x09\x0a\x0d\x20-\x7e\x85\xa0-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+
+# Plain scalars that YAML resolves to bool/null instead of str.
+_YAML_SPECIAL_WORDS = frozenset({
+    "yes", "no", "on", "off", "true", "false", "null",
+})
+
+
+def load_yaml(text: str) -> Any:
+    """Load a YAML document with safe_load semantics.
+
+    Raises yaml.YAMLError on malformed input, like yaml.safe_load.
+    """
+    data = fast_scalar_yaml(text)
+    if data is None:
+        data = fast_flow_map_yaml(text)
+    if data is not None:
+        return data
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it.
+    return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def __getattr__(name: str) -> Any:
+    # ``_yaml.YAMLError`` for except clauses, without importing PyYAML
+    # up front: the clause is only evaluated once something has raised.
+    if name == "YAMLError":
+        import yaml
+
+        return yaml.YAMLError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def fast_scalar_yaml(yaml_str: str) -> dict[str, str | None] | None:
+    """Parse frontmatter made only of ``key: plain-scalar`` lines.
+
+    Covers the common docket header without invoking PyYAML. Returns None
+    for anything else (nesting, lists, quoting, numbers, docket-status
+    maps, ...) so the caller falls back to the full YAML loader.
+    """
+    data: dict[str, str | None] = {}
+    for line in yaml_str.split("\n"):
+        if not line.strip(" "):
+            continue
+        if line.startswith("#"):
+            if _NON_PRINTABLE_RE.search(line) is not None:
+                return None
+            continue
+        m = _SIMPLE_LINE_RE.fullmatch(line)
+        if m is None:
+            return None
+        key, value = m.group(1), m.group(2)
+        if key.lower() in _YAML_SPECIAL_WORDS:
+            return None
+        if value is not None and value.lower() in _YAML_SPECIAL_WORDS:
+            return None
+        data[key] = value
+    return data or None
+
+
+def fast_flow_map_yaml(yaml_str: str) -> dict[str, Any] | None:
+    """Parse frontmatter whose keys hold plain scalars or flow-list maps.
+
+    Extends :func:`fast_scalar_yaml` to the ``docket-status`` shape: a key
+    with no value followed by equally indented ``name: [a, "b"]`` lines.
+    Returns None for anything else so the caller falls back to PyYAML.
+    """
+    data: dict[str, Any] = {}
+    # Key awaiting indented children, and the mapping they go into
+    open_key: str | None = None
+    children: dict[str, list[str]] | None = None
+    indent = 0
+    for line in yaml_str.split("\n"):
+        if not line.strip(" "):
+            continue
+        if line[0] == " ":
+            if open_key is None:
+                return None
+            m = _NESTED_LINE_RE.fullmatch(line)
+            if m is None:
+                return None
+            key = m.group(2)
+            if key.lower() in _YAML_SPECIAL_WORDS:
+                return None
+            if children is None:
+                indent = len(m.group(1))
+                children = data[open_key] = {}
+            elif len(m.group(1)) != indent:
+                return None
+            items = _flow_list(m.group(3))
+            if items is None:
+                return None
+            children[key] = items
+            continue
+        if line.startswith("#"):
+            if _NON_PRINTABLE_RE.search(line) is not None:
+                return None
+            continue
+        m = _SIMPLE_LINE_RE.fullmatch(line)
+        if m is None:
+            return None
+        key, value = m.group(1), m.group(2)
+        if key.lower() in _YAML_SPECIAL_WORDS:
+            return None
+        if value is not None and value.lower() in _YAML_SPECIAL_WORDS:
+            return None
+        data[key] = value
+        open_key = key if value is None else None
+        children = None
+    return data or None
+
+
+def _flow_list(text: str) -> list[str] | None:
+    """Items of a ``[...]`` flow list of strings, or None if not that simple."""
+    if _FLOW_LIST_RE.fullmatch(text) is None:
+        return None
+    items: list[str] = []
+    for token in _FLOW_ITEM_RE.findall(text):
+        if token[0] == '"':
+            items.append(token[1:-1])
+        elif token.lower() in _YAML_SPECIAL_WORDS:
+            return None
+        else:
+            items.append(token)
+    return items
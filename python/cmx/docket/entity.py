@@ -8,16 +8,92 @@ Matches Rust skill-docket entity.rs exactly.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 
+from ._compat import DATACLASS_SLOTS
+from ._lines import HEADING_LINE_RE, normalize_newlines
 from .frontmatter import DocketFrontmatter
 from .kv import KvFormat, parse_kv, detect_format, serialize_kv
 from .status import StatusMap
 
 
-@dataclass
-class Entity:
-    """A parsed entity from a docket-marked markdown file."""
+# docket-format names, in the precedence order used for template matching.
+_FORMAT_NAMES: dict[str, KvFormat] = {
+    "kv-colons": KvFormat.COLONS,
+    "kv-packed": KvFormat.PACKED,
+    "kv-table": KvFormat.TABLE,
+    "kv-frontmatter": KvFormat.FRONTMATTER,
+}
+_FORMAT_PLACEHOLDERS: tuple[tuple[str, KvFormat], ...] = tuple(
+    ("{" + name + "}", fmt) for name, fmt in _FORMAT_NAMES.items()
+)
+
+
+# Entity fields filled in from the body when it is parsed.
+_LAZY_FIELDS = frozenset(("entity_type", "status", "fields", "kv_format"))
+
+
+class _LazyBody:
+    """Deferred KV parsing for Entity.
+
+    The parsers leave the lazy fields' slots unset and record what the
+    parse needs in ``_pending``; the first read of one of those fields
+    falls through to ``__getattr__``, which parses the body.
+    """
+
+    __slots__ = ("_pending",)
+
+    def __getattr__(self, name: str):
+        # Only reached when normal lookup fails, i.e. for an unset slot.
+        if name == "_pending":
+            return None
+        if name in _LAZY_FIELDS and self._pending is not None:
+            self._resolve()
+            return getattr(self, name)
+        raise AttributeError(
+            f"{self.__class__.__name__!r} object has no attribute {name!r}"
+        )
+
+    def _resolve(self) -> None:
+        """Parse the deferred body into fields, format, type and status."""
+        default_type, format_hint, status = self._pending
+        self._pending = None
+
+        body = self.body
+        # A format declared in the frontmatter wins; otherwise detect it
+        # from the body, defaulting to colons
+        if format_hint is not None or body.strip():
+            kv_format = detect_format(body, format_hint)
+        else:
+            kv_format = KvFormat.COLONS
+
+        # parse_kv interns field keys; status/type values recur across
+        # entities too, so intern them here.
+        intern = sys.intern
+        fields = parse_kv(body, kv_format)
+
+        # Check for inline Type override
+        entity_type = fields.pop("Type", None) or fields.pop("type", None) or default_type
+
+        # If status is in fields but not in heading, use the field value
+        if status is None:
+            status = fields.pop("Status", None) or fields.pop("status", None)
+
+        self.entity_type = intern(entity_type)
+        self.status = intern(status) if status is not None else None
+        self.fields = fields
+        self.kv_format = kv_format
+
+
+@dataclass(**DATACLASS_SLOTS)
+class Entity(_LazyBody):
+    """A parsed entity from a docket-marked markdown file.
+
+    Entities produced by the parsers defer KV parsing of ``body`` until
+    ``fields``, ``kv_format``, ``entity_type`` or ``status`` is first read,
+    so listing headings never pays for field extraction.
+    """
 
     name: str
     title: str
@@ -31,7 +107,15 @@ class Entity:
     line_number: int = 0
 
 
-@dataclass
+if not DATACLASS_SLOTS:
+    # Unslotted, the field defaults stay on the class and would answer for
+    # an unparsed entity before __getattr__ is consulted.
+    for _name in _LAZY_FIELDS:
+        if _name in Entity.__dict__:
+            delattr(Entity, _name)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class EntityTree:
     """A tree of entities reflecting the heading hierarchy."""
 
@@ -56,48 +140,74 @@ def parse_outline(
     default_type = frontmatter.docket_type or ""
     format_hint = _parse_format_hint(frontmatter.docket_format)
 
-    # Collect raw entities with their heading levels
-    raw_entities: list[tuple[int, Entity]] = []
-    current_heading: tuple[int, str, str, str | None, str | None, int] | None = None
-    current_body_lines: list[str] = []
-
-    for line_idx, line in enumerate(body.splitlines()):
-        trimmed = line.strip()
-        heading = _parse_heading(trimmed)
-        if heading is not None:
-            level, rest = heading
-            # Flush previous entity
-            if current_heading is not None:
-                h_level, name, title, status, status_raw, h_line = current_heading
-                entity_body = "\n".join(current_body_lines) + ("\n" if current_body_lines else "")
-                entity = _build_entity(
-                    name, title, default_type, status, status_raw,
-                    entity_body, h_level, h_line, format_hint,
-                )
-                raw_entities.append((h_level, entity))
-                current_body_lines = []
-
-            # Parse this heading
-            status, status_raw, name, title = _parse_heading_content(rest, status_map)
+    # Jump from candidate heading line to candidate heading line; entity
+    # bodies are sliced out of the original string at flush time.
+    body = normalize_newlines(body)
 
-            if name:
-                current_heading = (level, name, title, status, status_raw, line_idx + 1)
-            else:
-                current_heading = None
-        elif current_heading is not None:
-            current_body_lines.append(line)
+    # Trees are attached as each heading is flushed; stack holds the open
+    # (level, tree) chain from the outermost heading to the innermost.
+    roots: list[EntityTree] = []
+    stack: list[tuple[int, EntityTree]] = []
+    current_heading: tuple[int, str, str, str | None, str | None, int] | None = None
+    body_start = 0
+
+    # Bind hot callables to locals (LOAD_FAST instead of LOAD_GLOBAL/ATTR)
+    count = body.count
+    parse_heading = _parse_heading
+    parse_heading_content = _parse_heading_content
+    build_entity = _build_entity
+    push = stack.append
+    pop = stack.pop
+
+    # 0-based index of the line starting at offset counted_to
+    line_idx = 0
+    counted_to = 0
+    for m in HEADING_LINE_RE.finditer(body):
+        heading = parse_heading(m.group().strip())
+        if heading is None:
+            continue
+        start = m.start()
+        line_idx += count("\n", counted_to, start)
+        counted_to = start
+
+        level, rest = heading
+        # Flush previous entity into its parent
+        if current_heading is not None:
+            h_level, name, title, status, status_raw, h_line = current_heading
+            tree = EntityTree(build_entity(
+                name, title, default_type, status, status_raw,
+                body[body_start:start], h_level, h_line, format_hint,
+            ), [])
+            # Close headings at the same level or deeper
+            while stack and stack[-1][0] >= h_level:
+                pop()
+            (stack[-1][1].children if stack else roots).append(tree)
+            push((h_level, tree))
+
+        # Parse this heading
+        status, status_raw, name, title = parse_heading_content(rest, status_map)
+
+        if name:
+            current_heading = (level, name, title, status, status_raw, line_idx + 1)
+            body_start = m.end() + 1
+        else:
+            current_heading = None
 
     # Flush last entity
     if current_heading is not None:
+        entity_body = body[body_start:]
+        if entity_body and not entity_body.endswith("\n"):
+            entity_body += "\n"
         h_level, name, title, status, status_raw, h_line = current_heading
-        entity_body = "\n".join(current_body_lines) + ("\n" if current_body_lines else "")
-        entity = _build_entity(
+        tree = EntityTree(build_entity(
             name, title, default_type, status, status_raw,
             entity_body, h_level, h_line, format_hint,
-        )
-        raw_entities.append((h_level, entity))
+        ), [])
+        while stack and stack[-1][0] >= h_level:
+            pop()
+        (stack[-1][1].children if stack else roots).append(tree)
 
-    return _nest_entities(raw_entities)
+    return roots
 
 
 def parse_file_entity(
@@ -109,18 +219,21 @@ def parse_file_entity(
     default_type = frontmatter.docket_type or ""
     format_hint = _parse_format_hint(frontmatter.docket_format)
 
-    for line_idx, line in enumerate(body.splitlines()):
-        trimmed = line.strip()
-        heading = _parse_heading(trimmed)
+    body = normalize_newlines(body)
+    for m in HEADING_LINE_RE.finditer(body):
+        heading = _parse_heading(m.group().strip())
         if heading is not None:
             _level, rest = heading
             status, status_raw, name, title = _parse_heading_content(rest, status_map)
             if name:
-                remaining_lines = body.splitlines()[line_idx + 1:]
-                remaining_body = "\n".join(remaining_lines)
+                # Everything after the heading line, minus one trailing newline
+                remaining_body = body[m.end() + 1:]
+                if remaining_body.endswith("\n"):
+                    remaining_body = remaining_body[:-1]
+                line_number = body.count("\n", 0, m.start()) + 1
                 return _build_entity(
                     name, title, default_type, status, status_raw,
-                    remaining_body, 1, line_idx + 1, format_hint,
+                    remaining_body, 1, line_number, format_hint,
                 )
     return None
 
@@ -172,15 +285,11 @@ def _parse_heading(line: str) -> tuple[int, str] | None:
     """
     if not line.startswith("#"):
         return None
-    level = 0
-    for ch in line:
-        if ch == "#":
-            level += 1
-        else:
-            break
-    if level < 1 or level > 6:
+    stripped = line.lstrip("#")
+    level = len(line) - len(stripped)
+    if level > 6:
         return None
-    rest = line[level:].strip()
+    rest = stripped.strip()
     if not rest:
         return None
     return level, rest
@@ -201,45 +310,44 @@ def _extract_status_prefix(
     status_map: StatusMap,
 ) -> tuple[str | None, str | None, str]:
     """Try to extract a status marker from the beginning of a heading."""
-    for canonical, representations in status_map.forward.items():
-        for repr_str in representations:
-            if s.startswith(repr_str):
-                rest = s[len(repr_str):].lstrip()
-                return canonical, repr_str, rest
+    matched = status_map.match_prefix(s)
+    if matched is not None:
+        canonical, repr_str, end = matched
+        return canonical, repr_str, s[end:].lstrip()
     return None, None, s
 
 
 def _split_name_title(s: str) -> tuple[str, str]:
     """Split heading content on em-dash or spaced double-hyphen."""
-    # Try em-dash first
-    pos = s.find("\u2014")
-    if pos >= 0:
-        name = s[:pos].strip()
-        title = s[pos + 1:].strip()  # em-dash is 1 char in Python
-        return name, title
+    # Try em-dash first (an ASCII-only heading cannot contain one)
+    if not s.isascii():
+        name, sep, title = s.partition("\u2014")
+        if sep:
+            return name.strip(), title.strip()
     # Try spaced double-hyphen
-    pos = s.find(" -- ")
-    if pos >= 0:
-        name = s[:pos].strip()
-        title = s[pos + 4:].strip()
-        return name, title
+    name, sep, title = s.partition(" -- ")
+    if sep:
+        return name.strip(), title.strip()
     # No separator -- entire string is the name
-    return s.strip(), s.strip()
+    s = s.strip()
+    return s, s
 
 
-def _parse_format_hint(format_str: str | None) -> KvFormat:
-    """Parse the docket-format string into a KvFormat."""
+def _parse_format_hint(format_str: str | None) -> KvFormat | None:
+    """Parse the docket-format string into the KvFormat it declares, if any."""
     if format_str is None:
-        return KvFormat.COLONS
-    if format_str == "kv-colons" or "{kv-colons}" in format_str:
-        return KvFormat.COLONS
-    if format_str == "kv-packed" or "{kv-packed}" in format_str:
-        return KvFormat.PACKED
-    if format_str == "kv-table" or "{kv-table}" in format_str:
-        return KvFormat.TABLE
-    if format_str == "kv-frontmatter" or "{kv-frontmatter}" in format_str:
-        return KvFormat.FRONTMATTER
-    return KvFormat.COLONS
+        return None
+    if isinstance(format_str, str):
+        fmt = _FORMAT_NAMES.get(format_str)
+        if fmt is not None:
+            return fmt
+        if "{kv-" not in format_str:
+            return None
+    # Template form, e.g. "{name} {kv-table}"; first listed format wins
+    for placeholder, fmt in _FORMAT_PLACEHOLDERS:
+        if placeholder in format_str:
+            return fmt
+    return None
 
 
 def _build_entity(
@@ -251,66 +359,19 @@ def _build_entity(
     body: str,
     heading_level: int,
     line_number: int,
-    format_hint: KvFormat,
+    format_hint: KvFormat | None,
 ) -> Entity:
-    """Build an Entity from parsed heading and body data."""
-    # Detect format from body, or use hint
-    if body.strip():
-        kv_format = detect_format(body)
-    else:
-        kv_format = format_hint
-
-    fields = parse_kv(body, kv_format)
-
-    # Check for inline Type override
-    entity_type = fields.pop("Type", None) or fields.pop("type", None) or default_type
-
-    # If status is in fields but not in heading, use the field value
-    effective_status = status
-    if effective_status is None:
-        effective_status = fields.pop("Status", None) or fields.pop("status", None)
+    """Build an Entity from parsed heading and body data.
 
-    return Entity(
-        name=name,
-        title=title,
-        entity_type=entity_type,
-        status=effective_status,
-        status_raw=status_raw,
-        fields=fields,
-        kv_format=kv_format,
-        body=body,
-        heading_level=heading_level,
-        line_number=line_number,
-    )
-
-
-def _nest_entities(items: list[tuple[int, Entity]]) -> list[EntityTree]:
-    """Build a tree from a flat list of (depth, Entity) pairs."""
-    if not items:
-        return []
-
-    roots: list[EntityTree] = []
-    stack: list[tuple[int, EntityTree]] = []
-
-    for depth, entity in items:
-        tree = EntityTree(entity=entity, children=[])
-
-        # Pop stack entries at same level or deeper
-        while stack and stack[-1][0] >= depth:
-            _, popped = stack.pop()
-            if stack:
-                stack[-1][1].children.append(popped)
-            else:
-                roots.append(popped)
-
-        stack.append((depth, tree))
-
-    # Flush remaining stack
-    while stack:
-        _, popped = stack.pop()
-        if stack:
-            stack[-1][1].children.append(popped)
-        else:
-            roots.append(popped)
-
-    return roots
+    KV parsing is deferred until the entity's fields are first accessed.
+    """
+    # Set only the eager fields; the lazy ones stay unset until read.
+    entity = Entity.__new__(Entity)
+    entity.name = name
+    entity.title = title
+    entity.status_raw = sys.intern(status_raw) if status_raw is not None else None
+    entity.body = body
+    entity.heading_level = heading_level
+    entity.line_number = line_number
+    entity._pending = (default_type, format_hint, status)
+    return entity
@@ -9,15 +9,26 @@ Matches Rust skill-docket frontmatter.rs exactly.
 from __future__ import annotations
 
 import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
-import yaml
-
+from . import _yaml
+from ._compat import DATACLASS_SLOTS
+from ._yaml import load_yaml
 from .kv import KvFormat
 from .status import StatusMap
 
+# Below this many candidate files scan_directory reads serially; thread
+# start-up would cost more than the overlapped I/O saves.
+_PARALLEL_SCAN_MIN_FILES = 16
+
+# Leading whitespace before the opening fence (same set as str.lstrip()).
+_LEADING_WS_RE = re.compile(r"\s*")
+
 
 class DocketLayout(Enum):
     OUTLINE = "outline"
@@ -25,7 +36,7 @@ class DocketLayout(Enum):
     FOLDER = "folder"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DocketFrontmatter:
     docket_type: str | None = None
     docket_layout: DocketLayout | None = None
@@ -34,12 +45,35 @@ class DocketFrontmatter:
     docket_regex: str | None = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DocketFile:
     path: Path
     frontmatter: DocketFrontmatter
     body: str
     byte_offset: int  # where body starts after frontmatter
+    mtime_ms: int | None = None  # stat taken by scan_directory, if any
+
+
+# Parsed-file cache for scan_directory:
+# path -> (st_mtime_ns, st_size, DocketFile | None, body, byte_offset).
+# body/byte_offset are the inheritable body of a file without its own
+# docket frontmatter (unused when DocketFile is set); body is None when the
+# file had no fence and was never decoded because nothing inherited it.
+# Keyed by the scanned path string.
+_parse_cache: dict[str, tuple[int, int, DocketFile | None, str | None, int]] = {}
+# Serializes writes to _parse_cache and the prune across concurrent scans;
+# single get() lookups need no lock.
+_parse_cache_lock = threading.Lock()
+
+# Past this many entries, a scan drops cached files it did not visit itself.
+_SCAN_CACHE_SIZE = 4096
+
+# Bytes read from a scanned file before deciding whether it has a fence.
+_PEEK_SIZE = 4096
+
+# Leading bytes str.lstrip() would treat as whitespace but bytes.lstrip()
+# would not; a file starting with one of these is always decoded.
+_UNSURE_LEAD_BYTES = frozenset(range(0x1c, 0x20)) | frozenset(range(0x80, 0x100))
 
 
 # ---------------------------------------------------------------------------
@@ -78,10 +112,56 @@ def scan_directory(dir_path: Path) -> list[DocketFile]:
 
     Follows folder markers: if a directory contains ``.docket-folder.md``,
     all ``.md`` files in that directory inherit its docket settings.
+
+    Unchanged files (same mtime and size as the previous scan) are served
+    from a module-level cache instead of being re-read and re-parsed; each
+    call gets its own DocketFile and frontmatter objects. Once
+    the cache outgrows ``_SCAN_CACHE_SIZE``, entries for files this scan did
+    not visit are dropped.
+    The directory walk and cache checks are serial; reads of new or
+    changed files run on a thread pool.
     """
-    results: list[DocketFile] = []
-    _scan_dir_recursive(dir_path, None, results)
-    return results
+    candidates = _collect_candidates(dir_path)
+
+    # Unchanged files are served from the cache right away; only the files
+    # that must actually be read are handed to the pool.
+    loaded: list[DocketFile | None] = [None] * len(candidates)
+    misses: list[tuple[int, str, DocketFrontmatter | None, os.stat_result]] = []
+    for i, (path, inherited) in enumerate(candidates):
+        try:
+            st = os.stat(path)
+        except OSError:
+            _cache_drop(path)
+            continue
+        hit = _cache_hit(path, st, need_body=inherited is not None)
+        if hit is not None:
+            loaded[i] = _with_inherited(path, inherited, hit)
+        else:
+            misses.append((i, path, inherited, st))
+
+    if len(misses) < _PARALLEL_SCAN_MIN_FILES:
+        for miss in misses:
+            loaded[miss[0]] = _load_miss(miss)
+    else:
+        workers = min(32, (os.cpu_count() or 1) * 4, len(misses))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for miss, docket_file in zip(misses, pool.map(_load_miss, misses)):
+                loaded[miss[0]] = docket_file
+
+    if len(_parse_cache) > _SCAN_CACHE_SIZE:
+        # Pruned here, after the pool, so no reader sees an entry vanish
+        visited = {path for path, _ in candidates}
+        with _parse_cache_lock:
+            for path in [p for p in _parse_cache if p not in visited]:
+                _parse_cache.pop(path, None)
+
+    return [f for f in loaded if f is not None]
+
+
+def clear_scan_cache() -> None:
+    """Drop all cached file parses used by scan_directory."""
+    with _parse_cache_lock:
+        _parse_cache.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -93,46 +173,68 @@ def _extract_frontmatter(content: str) -> tuple[str, str, int] | None:
 
     Returns (yaml_str, body, body_offset) or None if no frontmatter.
     """
-    trimmed = content.lstrip()
-    if not trimmed.startswith("---"):
+    # Work with offsets into content; no lstrip() copy of the document.
+    start = _LEADING_WS_RE.match(content).end()
+    if not content.startswith("---", start):
         return None
 
-    after_first = trimmed[3:]
-    if after_first.startswith("\n"):
-        after_first = after_first[1:]
+    yaml_start = start + 3
+    if content.startswith("\n", yaml_start):
+        yaml_start += 1
 
-    end = after_first.find("\n---")
+    end = content.find("\n---", yaml_start)
     if end < 0:
         return None
 
-    yaml_str = after_first[:end]
-
-    # Find where body starts (after the closing --- line)
-    rest_after_close = after_first[end + 4:]
-    nl_pos = rest_after_close.find("\n")
-    if nl_pos >= 0:
-        body_start = end + 4 + nl_pos + 1
-    else:
-        body_start = len(after_first)
+    yaml_str = content[yaml_start:end]
 
-    # Compute actual offset in original content
-    leading = len(content) - len(trimmed)
-    first_fence_len = 3
-    strip_newline = 1 if trimmed[3:].startswith("\n") else 0
-    offset = leading + first_fence_len + strip_newline + body_start
+    # Body starts after the closing --- line
+    nl_pos = content.find("\n", end + 4)
+    offset = nl_pos + 1 if nl_pos >= 0 else len(content)
 
     body = content[offset:]
     return yaml_str, body, offset
 
 
+def _peek_frontmatter_yaml(head: bytes) -> str | None:
+    """Return the frontmatter YAML if its closing fence lies within ``head``.
+
+    ``head`` is the start of a file's raw bytes. Returns the same string
+    _extract_frontmatter would find in the whole decoded file, or None when
+    that cannot be decided from ``head`` alone.
+    """
+    lead = head.lstrip()
+    if not lead.startswith(b"---"):
+        return None
+    start = len(head) - len(lead) + 3
+    # The closing fence in the translated text is "\n---"; a bare "\r"
+    # becomes "\n" too, so take whichever comes first.
+    ends = [e for e in (head.find(b"\n---", start), head.find(b"\r---", start)) if e >= 0]
+    if not ends:
+        return None
+    try:
+        text = head[:min(ends) + 4].decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    extracted = _extract_frontmatter(text)
+    return extracted[0] if extracted is not None else None
+
+
 def _parse_docket_yaml(yaml_str: str) -> DocketFrontmatter | None:
     """Parse docket frontmatter from a YAML string.
 
     Returns None if the YAML doesn't contain any docket keys.
     """
+    # Every docket key is spelled "docket-..."; without that substring the
+    # YAML cannot produce one unless a quoted key is written with escapes.
+    if "docket-" not in yaml_str and "\\" not in yaml_str:
+        return None
+
     try:
-        data = yaml.safe_load(yaml_str)
-    except yaml.YAMLError:
+        data = load_yaml(yaml_str)
+    except _yaml.YAMLError:
         return None
 
     if not isinstance(data, dict):
@@ -161,64 +263,212 @@ def _parse_docket_yaml(yaml_str: str) -> DocketFrontmatter | None:
     return fm
 
 
-def _scan_dir_recursive(
-    dir_path: Path,
-    inherited: DocketFrontmatter | None,
-    results: list[DocketFile],
-) -> None:
-    # Check for folder marker first
-    marker_path = dir_path / ".docket-folder.md"
-    folder_fm: DocketFrontmatter | None = None
-    if marker_path.exists():
-        content = marker_path.read_text()
-        extracted = _extract_frontmatter(content)
-        if extracted is not None:
-            yaml_str, _, _ = extracted
-            folder_fm = _parse_docket_yaml(yaml_str)
+def _collect_candidates(
+    root: Path,
+) -> list[tuple[str, DocketFrontmatter | None]]:
+    """Collect (path, inherited frontmatter) for every markdown file, in scan order.
+
+    Paths are the ``DirEntry.path`` strings; no ``Path`` is built per file.
+    Directories are walked depth-first with an explicit stack, each one's
+    files before its subdirectories, in name order.
+    """
+    candidates: list[tuple[str, DocketFrontmatter | None]] = []
+    stack: list[tuple[str | Path, DocketFrontmatter | None]] = [(root, None)]
+
+    while stack:
+        dir_path, inherited = stack.pop()
+        # DirEntry caches name and type from the directory read, so is_dir()
+        # needs no extra stat for regular entries.
+        try:
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+
+        # Check for folder marker first
+        folder_fm: DocketFrontmatter | None = None
+        for e in entries:
+            if e.name == ".docket-folder.md":
+                with open(e.path) as f:
+                    content = f.read()
+                extracted = _extract_frontmatter(content)
+                if extracted is not None:
+                    yaml_str, _, _ = extracted
+                    folder_fm = _parse_docket_yaml(yaml_str)
+                break
 
-    effective_inherited = folder_fm if folder_fm is not None else inherited
+        effective_inherited = folder_fm if folder_fm is not None else inherited
 
-    subdirs: list[Path] = []
+        subdirs: list[str] = []
 
+        for entry in entries:
+            name = entry.name
+
+            if entry.is_dir():
+                if not name.startswith("."):
+                    subdirs.append(entry.path)
+                continue
+
+            # Skip non-markdown and marker files
+            if not name.endswith(".md") or name == ".docket-folder.md":
+                continue
+
+            candidates.append((entry.path, effective_inherited))
+
+        # Pushed in reverse so the first subdirectory is walked next
+        for subdir in reversed(subdirs):
+            stack.append((subdir, effective_inherited))
+
+    return candidates
+
+
+def _load_miss(
+    miss: tuple[int, str, DocketFrontmatter | None, os.stat_result],
+) -> DocketFile | None:
+    """Read one scanned file the cache could not serve."""
+    _, path, inherited, st = miss
+    parsed = _read_file(path, st, need_body=inherited is not None)
+    if parsed is None:
+        return None
+    return _with_inherited(path, inherited, parsed)
+
+
+def _with_inherited(
+    path: str,
+    inherited: DocketFrontmatter | None,
+    parsed: tuple[DocketFile | None, str | None, int, int],
+) -> DocketFile | None:
+    """Apply the inherited folder frontmatter to one file's parse."""
+    docket_file, body, byte_offset, mtime_ms = parsed
+
+    if docket_file is not None:
+        # The parse is cached; callers get their own objects to mutate
+        return _copy_docket_file(docket_file)
+    if inherited is not None:
+        # File has no docket frontmatter but inherits from folder marker
+        return DocketFile(
+            path=Path(path),
+            frontmatter=inherited,
+            body=body,
+            byte_offset=byte_offset,
+            mtime_ms=mtime_ms,
+        )
+    return None
+
+
+def _cache_hit(
+    path: str,
+    st: os.stat_result,
+    need_body: bool,
+) -> tuple[DocketFile | None, str | None, int, int] | None:
+    """Return the cached parse of ``path`` if ``st`` shows it unchanged.
+
+    The result has the same shape as _read_file's.
+    """
+    hit = _parse_cache.get(path)
+    if (hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size
+            and (hit[3] is not None or hit[2] is not None or not need_body)):
+        return hit[2], hit[3], hit[4], int(st.st_mtime * 1000)
+    return None
+
+
+def _read_file(
+    path: str,
+    st: os.stat_result,
+    need_body: bool = True,
+) -> tuple[DocketFile | None, str | None, int, int] | None:
+    """Read and parse a markdown file, caching the parse under ``st``.
+
+    Returns (docket_file, body, byte_offset, mtime_ms), or None if the file
+    is unreadable. When the file has no docket frontmatter, docket_file is None
+    and body/byte_offset describe what a folder marker would inherit.
+
+    Files are read as bytes. One with no leading ``---`` fence is only
+    decoded when ``need_body`` is set; otherwise body is None.
+    """
+    mtime_ms = int(st.st_mtime * 1000)
+
+    # Peek at the head first. Cheap fence check on the raw bytes: most
+    # markdown has no frontmatter, and then the rest of the file is never
+    # read unless a folder marker needs the body. Fenced files whose YAML
+    # closes inside the peek are judged from that YAML alone.
+    head_fm: DocketFrontmatter | None = None
     try:
-        entries = sorted(dir_path.iterdir())
+        with open(path, "rb") as f:
+            data = f.read(_PEEK_SIZE)
+            if not need_body:
+                lead = data.lstrip()
+                if (lead and (len(lead) >= 3 or len(data) < _PEEK_SIZE)
+                        and not lead.startswith(b"---")
+                        and lead[0] not in _UNSURE_LEAD_BYTES):
+                    _cache_put(path, (st.st_mtime_ns, st.st_size, None, None, 0))
+                    return None, None, 0, mtime_ms
+                yaml_str = _peek_frontmatter_yaml(data)
+                if yaml_str is not None:
+                    head_fm = _parse_docket_yaml(yaml_str)
+                    if head_fm is None:
+                        # Someone else's frontmatter: nothing to inherit
+                        _cache_put(path, (st.st_mtime_ns, st.st_size, None, None, 0))
+                        return None, None, 0, mtime_ms
+            data += f.read()
     except OSError:
-        return
+        _cache_drop(path)
+        return None
 
-    for entry in entries:
-        name = entry.name
+    content = data.decode("utf-8")
+    if "\r" in content:
+        # Match read_text()'s universal-newline translation
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
 
-        if entry.is_dir():
-            if not name.startswith("."):
-                subdirs.append(entry)
-            continue
+    # Extract the fence once and reuse it for both the docket check and
+    # the inherited-body fallback.
+    docket_file: DocketFile | None = None
+    extracted = _extract_frontmatter(content)
+    if extracted is not None:
+        yaml_str, body, byte_offset = extracted
+        fm = head_fm if head_fm is not None else _parse_docket_yaml(yaml_str)
+        if fm is not None:
+            docket_file = DocketFile(
+                path=Path(path), frontmatter=fm, body=body, byte_offset=byte_offset,
+                mtime_ms=mtime_ms,
+            )
+            body, byte_offset = "", 0
+    else:
+        body, byte_offset = content, 0
 
-        # Skip non-markdown and marker files
-        if not name.endswith(".md") or name == ".docket-folder.md":
-            continue
+    _cache_put(path, (st.st_mtime_ns, st.st_size, docket_file, body, byte_offset))
+    return docket_file, body, byte_offset, mtime_ms
 
-        try:
-            content = entry.read_text()
-        except OSError:
-            continue
 
-        docket_file = parse_file(entry, content)
-        if docket_file is not None:
-            results.append(docket_file)
-        elif effective_inherited is not None:
-            # File has no docket frontmatter but inherits from folder marker
-            extracted = _extract_frontmatter(content)
-            if extracted is not None:
-                _, body, byte_offset = extracted
-            else:
-                body = content
-                byte_offset = 0
-            results.append(DocketFile(
-                path=entry,
-                frontmatter=effective_inherited,
-                body=body,
-                byte_offset=byte_offset,
-            ))
-
-    for subdir in subdirs:
-        _scan_dir_recursive(subdir, effective_inherited, results)
+def _cache_put(
+    path: str,
+    entry: tuple[int, int, DocketFile | None, str | None, int],
+) -> None:
+    with _parse_cache_lock:
+        _parse_cache[path] = entry
+
+
+def _cache_drop(path: str) -> None:
+    with _parse_cache_lock:
+        _parse_cache.pop(path, None)
+
+
+def _copy_docket_file(docket_file: DocketFile) -> DocketFile:
+    """Copy a cached DocketFile down to its docket-status lists."""
+    fm = docket_file.frontmatter
+    status = fm.docket_status
+    return DocketFile(
+        path=docket_file.path,
+        frontmatter=DocketFrontmatter(
+            docket_type=fm.docket_type,
+            docket_layout=fm.docket_layout,
+            docket_format=fm.docket_format,
+            docket_status=(
+                {k: list(v) for k, v in status.items()} if status is not None else None
+            ),
+            docket_regex=fm.docket_regex,
+        ),
+        body=docket_file.body,
+        byte_offset=docket_file.byte_offset,
+        mtime_ms=docket_file.mtime_ms,
+    )
@@ -11,9 +11,13 @@ Matches Rust skill-docket kv.rs exactly.
 
 from __future__ import annotations
 
+import re
+import sys
 from enum import Enum
 
-import yaml
+from . import _yaml
+from ._lines import iter_lines, lines_with_hint, normalize_newlines
+from ._yaml import load_yaml
 
 
 class KvFormat(Enum):
@@ -23,12 +27,32 @@ class KvFormat(Enum):
     FRONTMATTER = "kv-frontmatter"
 
 
+# Substrings a line must contain to be relevant to a scanner. Lines without
+# a hint can never match, so scanners jump from hint to hint with a
+# compiled search instead of visiting every line.
+_DETECT_HINT_RE = re.compile(r"---|::|\|")
+_COLONS_HINT_RE = re.compile(r"::")
+
+# kv-table separator row: every cell, once stripped, is empty or made only
+# of '-', '\u2014' and spaces. Written so whitespace can only match one way.
+_TABLE_SEP_RE = re.compile(r"\|(?:\s*(?:[-\u2014](?:[-\u2014 ]*[-\u2014])?\s*)?\|)+")
+# kv-table line: whitespace-trimmed, it starts and ends with "|". Groups 1
+# and 2 are the first two cells, set only when the line has 3+ pipes.
+_TABLE_LINE_RE = re.compile(
+    r"^[^\S\n]*\|(?:([^|\n]*)\|([^|\n]*)\|(?:[^\n]*\|)?|(?:[^|\n]*\|)?)[^\S\n]*$",
+    re.MULTILINE,
+)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 def parse_kv(body: str, fmt: KvFormat) -> dict[str, str]:
-    """Parse key-value fields from body text using the specified format."""
+    """Parse key-value fields from body text using the specified format.
+
+    Field keys are interned, since the same few names recur across entities.
+    """
     if fmt == KvFormat.COLONS:
         return _parse_colons(body)
     elif fmt == KvFormat.PACKED:
@@ -40,12 +64,16 @@ def parse_kv(body: str, fmt: KvFormat) -> dict[str, str]:
     return {}
 
 
-def detect_format(body: str) -> KvFormat:
+def detect_format(body: str, hint: KvFormat | None = None) -> KvFormat:
     """Auto-detect the KV format used in body text.
 
-    Detection priority: frontmatter -> packed -> colons -> table.
+    Detection priority: frontmatter -> packed -> colons -> table, applied
+    per line; the first line that proves any format decides, so the scan
+    stops there. A declared ``hint`` is returned as-is without scanning.
     """
-    for line in body.splitlines():
+    if hint is not None:
+        return hint
+    for line in lines_with_hint(body, _DETECT_HINT_RE):
         trimmed = line.strip()
         # kv-frontmatter (--- within section body)
         if trimmed == "---":
@@ -64,11 +92,9 @@ def detect_format(body: str) -> KvFormat:
             before = trimmed[:-2]
             if before and "  " not in before:
                 return KvFormat.COLONS
-        # kv-table (| Field | Value |)
-        if trimmed.startswith("|") and trimmed.endswith("|"):
-            cells = trimmed.split("|")
-            if len(cells) >= 3:
-                return KvFormat.TABLE
+        # kv-table (| Field | Value |); 3+ cells, counted without splitting
+        if trimmed.startswith("|") and trimmed.endswith("|") and trimmed.count("|") >= 2:
+            return KvFormat.TABLE
     # Default to colons if nothing detected
     return KvFormat.COLONS
 
@@ -86,30 +112,53 @@ def serialize_kv(fields: dict[str, str], fmt: KvFormat) -> str:
     return ""
 
 
+# ---------------------------------------------------------------------------
+# Serializer key order
+# ---------------------------------------------------------------------------
+
+# (field keys in dict order, case-insensitive?) -> sorted keys. Entities of
+# one docket share a field schema, so most serializations hit.
+_SORTED_KEYS_CACHE: dict[tuple[tuple[str, ...], bool], tuple[str, ...]] = {}
+_SORTED_KEYS_CACHE_SIZE = 1024
+
+
+def _sorted_keys(fields: dict[str, str], case_insensitive: bool) -> tuple[str, ...]:
+    """Return the serialization order of ``fields``' keys, memoized by key set."""
+    cache_key = (tuple(fields), case_insensitive)
+    ordered = _SORTED_KEYS_CACHE.get(cache_key)
+    if ordered is None:
+        if len(_SORTED_KEYS_CACHE) >= _SORTED_KEYS_CACHE_SIZE:
+            _SORTED_KEYS_CACHE.clear()
+        ordered = tuple(sorted(fields, key=str.lower if case_insensitive else None))
+        _SORTED_KEYS_CACHE[cache_key] = ordered
+    return ordered
+
+
 # ---------------------------------------------------------------------------
 # kv-colons
 # ---------------------------------------------------------------------------
 
 def _parse_colons(body: str) -> dict[str, str]:
+    intern = sys.intern
     fields: dict[str, str] = {}
-    for line in body.splitlines():
+    for line in lines_with_hint(body, _COLONS_HINT_RE):
         trimmed = line.strip()
         pos = trimmed.find(":: ")
         if pos >= 0:
             key = trimmed[:pos].strip()
             value = trimmed[pos + 3:].strip()
             if key:
-                fields[key] = value
+                fields[intern(key)] = value
         elif trimmed.endswith("::") and not trimmed.startswith("#"):
             key = trimmed[:-2].strip()
             if key:
-                fields[key] = ""
+                fields[intern(key)] = ""
     return fields
 
 
 def _serialize_colons(fields: dict[str, str]) -> str:
     lines = []
-    for k in sorted(fields.keys()):
+    for k in _sorted_keys(fields, False):
         v = fields[k]
         if v:
             lines.append(f"{k}:: {v}")
@@ -123,19 +172,18 @@ def _serialize_colons(fields: dict[str, str]) -> str:
 # ---------------------------------------------------------------------------
 
 def _parse_packed(body: str) -> dict[str, str]:
+    intern = sys.intern
     fields: dict[str, str] = {}
-    for line in body.splitlines():
+    for line in lines_with_hint(body, _COLONS_HINT_RE):
         trimmed = line.strip()
         if trimmed.startswith(":: "):
             rest = trimmed[3:]
             for pair in rest.split(","):
-                pair = pair.strip()
-                pos = pair.find(":")
-                if pos >= 0:
-                    key = pair[:pos].strip()
-                    value = pair[pos + 1:].strip()
+                key, sep, value = pair.partition(":")
+                if sep:
+                    key = key.strip()
                     if key:
-                        fields[key] = value
+                        fields[intern(key)] = value.strip()
     return fields
 
 
@@ -149,20 +197,22 @@ def _serialize_packed(fields: dict[str, str]) -> str:
 # ---------------------------------------------------------------------------
 
 def _parse_table(body: str) -> dict[str, str]:
+    intern = sys.intern
     fields: dict[str, str] = {}
     in_table = False
     header_seen = False
-
-    for line in body.splitlines():
-        trimmed = line.strip()
-        if not trimmed.startswith("|") or not trimmed.endswith("|"):
-            if in_table:
-                break  # Table ended
-            continue
-
-        cells = [c.strip() for c in trimmed.split("|")]
-        # Need at least 4 parts (empty, field, value, empty) from split on |
-        if len(cells) < 4:
+    # Offset where the line after the last table line starts
+    next_line = 0
+
+    # Only table-shaped lines match; a skipped line shows up as a gap
+    for m in _TABLE_LINE_RE.finditer(normalize_newlines(body)):
+        if in_table and m.start() != next_line:
+            break  # Table ended
+        next_line = m.end() + 1
+
+        # Need at least 3 pipes (empty, field, value, empty parts on split)
+        key = m.group(1)
+        if key is None:
             continue
 
         if not in_table:
@@ -172,22 +222,21 @@ def _parse_table(body: str) -> dict[str, str]:
 
         if not header_seen:
             # This is the separator row (|---|---|)
-            if all(c == "" or all(ch in "-— " for ch in c) for c in cells[1:-1]):
+            if _TABLE_SEP_RE.fullmatch(m.group().strip()) is not None:
                 header_seen = True
                 continue
 
         # Data row
-        key = cells[1].strip()
-        value = cells[2].strip()
+        key = key.strip()
         if key:
-            fields[key] = value
+            fields[intern(key)] = m.group(2).strip()
 
     return fields
 
 
 def _serialize_table(fields: dict[str, str]) -> str:
     lines = ["| Field | Value |", "|-------|-------|"]
-    for k in sorted(fields.keys(), key=str.lower):
+    for k in _sorted_keys(fields, True):
         lines.append(f"| {k} | {fields[k]} |")
     return "\n".join(lines)
 
@@ -197,22 +246,23 @@ def _serialize_table(fields: dict[str, str]) -> str:
 # ---------------------------------------------------------------------------
 
 def _parse_section_frontmatter(body: str) -> dict[str, str]:
+    intern = sys.intern
     fields: dict[str, str] = {}
     in_yaml = False
     yaml_buf: list[str] = []
 
-    for line in body.splitlines():
+    for line in iter_lines(body):
         trimmed = line.strip()
         if trimmed == "---":
             if in_yaml:
                 # End of YAML block -- parse it
                 yaml_text = "\n".join(yaml_buf)
                 try:
-                    parsed = yaml.safe_load(yaml_text)
+                    parsed = load_yaml(yaml_text)
                     if isinstance(parsed, dict):
                         for k, v in parsed.items():
-                            fields[str(k)] = _yaml_value_to_string(v)
-                except yaml.YAMLError:
+                            fields[intern(str(k))] = _yaml_value_to_string(v)
+                except _yaml.YAMLError:
                     pass
                 yaml_buf.clear()
                 in_yaml = False
@@ -239,7 +289,7 @@ def _yaml_value_to_string(v: object) -> str:
 
 def _serialize_section_frontmatter(fields: dict[str, str]) -> str:
     lines = ["---"]
-    for k in sorted(fields.keys(), key=str.lower):
+    for k in _sorted_keys(fields, True):
         lines.append(f"{k}: {fields[k]}")
     lines.append("---")
     return "\n".join(lines)
@@ -9,11 +9,15 @@ Matches Rust skill-docket merge.rs exactly.
 
 from __future__ import annotations
 
+import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
+from ._compat import DATACLASS_SLOTS
+from ._lines import HEADING_LINE_RE, normalize_newlines
 from .entity import (
     Entity,
     EntityTree,
@@ -37,15 +41,19 @@ class FieldSourceKind(Enum):
     SECONDARY = "secondary"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class FieldSource:
-    """Tracks which file a field value came from."""
+    """Tracks which file a field value came from.
+
+    Frozen, since one instance is shared by every field a file contributes;
+    record a change by replacing a field's source, never by editing it.
+    """
 
     path: Path
     modified_ms: int = 0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MergedEntity:
     """A merged entity combining fields from multiple source files."""
 
@@ -60,6 +68,10 @@ class MergedEntity:
     children: list[MergedEntity] = field(default_factory=list)
 
 
+# Maximum number of per-file parse results a MergeStore keeps.
+PARSE_CACHE_SIZE = 2000
+
+
 class MergeStore:
     """The merge store -- accumulates entities from multiple files."""
 
@@ -67,45 +79,40 @@ class MergeStore:
         self.entities: dict[str, MergedEntity] = {}
         self.status_map = status_map if status_map is not None else StatusMap.default_map()
         self.loaded_files: list[Path] = []
+        # LRU of parsed files: path -> (mtime, body, frontmatter key, parsed)
+        self._parse_cache: OrderedDict[Path, tuple[int, str, tuple, object]] = OrderedDict()
+        # Names of entities changed by set_field since the last write_back
+        self._dirty_entities: set[str] = set()
 
     def load_file(self, docket_file: DocketFile) -> None:
         """Load a single docket file and merge its entities."""
-        mtime = _file_mtime(docket_file.path)
+        mtime = docket_file.mtime_ms
+        if mtime is None:
+            mtime = _file_mtime(docket_file.path)
         layout = (
             docket_file.frontmatter.docket_layout
             if docket_file.frontmatter.docket_layout is not None
             else DocketLayout.OUTLINE
         )
 
+        parsed = self._parse_cached(docket_file, layout, mtime)
+        # One source object is shared by every field this file contributes
+        source = FieldSource(path=docket_file.path, modified_ms=mtime)
         if layout == DocketLayout.OUTLINE:
-            trees = parse_outline(
-                docket_file.body,
-                docket_file.frontmatter,
-                self.status_map,
-            )
-            for tree in trees:
-                self._merge_tree(tree, docket_file.path, mtime)
-        elif layout == DocketLayout.FILE:
-            entity = parse_file_entity(
-                docket_file.body,
-                docket_file.frontmatter,
-                self.status_map,
-            )
-            if entity is not None:
-                self._merge_entity(entity, docket_file.path, mtime)
-        elif layout == DocketLayout.FOLDER:
-            entity = parse_file_entity(
-                docket_file.body,
-                docket_file.frontmatter,
-                self.status_map,
-            )
-            if entity is not None:
-                self._merge_entity(entity, docket_file.path, mtime)
+            for tree in parsed:
+                self._merge_tree(tree, source)
+        elif parsed is not None:
+            self._merge_entity(parsed, source)
 
         self.loaded_files.append(docket_file.path)
 
     def load_directory(self, dir_path: Path) -> None:
-        """Scan a directory and load all docket files found."""
+        """Scan a directory and load all docket files found.
+
+        File reads happen on scan_directory's thread pool; parsing and
+        merging stay serial, since both are GIL-bound and merge order
+        decides ties.
+        """
         files = scan_directory(dir_path)
         for f in files:
             self.load_file(f)
@@ -130,36 +137,77 @@ class MergeStore:
         if entity is None:
             raise KeyError(f"Entity '{entity_name}' not found")
 
+        # Share one key object with the parsed entities' field dicts
+        field_name = sys.intern(field_name)
         entity.fields[field_name] = value
+        self._dirty_entities.add(entity_name)
 
         if field_name.lower() == "status":
             entity.status = value
 
-        # Track field source -- use primary file for new fields
-        if field_name not in entity.field_sources:
-            entity.field_sources[field_name] = FieldSource(
-                path=entity.primary_file,
-                modified_ms=_now_ms(),
-            )
-        else:
-            entity.field_sources[field_name].modified_ms = _now_ms()
+        # Track field source -- use primary file for new fields. Sources are
+        # shared between the fields read from one file, so replace rather
+        # than mutate.
+        existing_source = entity.field_sources.get(field_name)
+        entity.field_sources[field_name] = FieldSource(
+            path=existing_source.path if existing_source is not None else entity.primary_file,
+            modified_ms=_now_ms(),
+        )
+
+    def mark_dirty(self, entity_name: str) -> None:
+        """Queue an entity for the next write_back.
+
+        set_field does this itself; call it after changing an entity's
+        ``fields`` or ``status`` directly.
+        """
+        if entity_name not in self.entities:
+            raise KeyError(f"Entity '{entity_name}' not found")
+        self._dirty_entities.add(entity_name)
 
     def write_back(self) -> list[Path]:
-        """Write back all modified entities to their source files."""
+        """Write back all modified entities to their source files.
+
+        Only files holding an entity changed by set_field since the last
+        write-back are read at all, and of those, files whose rewritten
+        content is identical to what is on disk are left untouched.
+        Changes made by assigning ``entity.fields`` or ``entity.status``
+        directly are not tracked; call mark_dirty for such an entity.
+
+        An entity stays pending until its file has been handled, so a
+        write-back that raises (or finds the file missing) can be retried.
+        Returns the paths that were actually written.
+        """
         written: list[Path] = []
-
-        # Group entities by their primary file
+        if not self._dirty_entities:
+            return written
+
+        # Files are resolved now, since primary_file may have been reassigned
+        dirty_by_file: dict[Path, list[str]] = {}
+        for name in list(self._dirty_entities):
+            entity = self.entities.get(name)
+            if entity is None:
+                self._dirty_entities.discard(name)
+            else:
+                dirty_by_file.setdefault(entity.primary_file, []).append(name)
+
+        # Group entities by their primary file; a dirty file is rewritten
+        # with all of its entities, clean ones included
         by_file: dict[Path, list[MergedEntity]] = {}
         for entity in self.entities.values():
-            by_file.setdefault(entity.primary_file, []).append(entity)
+            if entity.primary_file in dirty_by_file:
+                by_file.setdefault(entity.primary_file, []).append(entity)
 
         for path, entities in by_file.items():
-            if not path.exists():
+            try:
+                content = path.read_bytes().decode("utf-8")
+            except FileNotFoundError:
                 continue
-            content = path.read_text()
             updated = _update_file_content(content, entities, self.status_map)
-            path.write_text(updated)
-            written.append(path)
+            if updated != content:
+                path.write_bytes(updated.encode("utf-8"))
+                self._parse_cache.pop(path, None)
+                written.append(path)
+            self._dirty_entities.difference_update(dirty_by_file[path])
 
         return written
 
@@ -188,17 +236,16 @@ class MergeStore:
         target_file.write_text(content)
 
         # Add to in-memory store
-        mtime = _now_ms()
-        field_sources: dict[str, FieldSource] = {}
-        for key in fields:
-            field_sources[key] = FieldSource(path=target_file, modified_ms=mtime)
+        fields = {sys.intern(k): v for k, v in fields.items()}
+        source = FieldSource(path=target_file, modified_ms=_now_ms())
+        field_sources: dict[str, FieldSource] = dict.fromkeys(fields, source)
 
         merged = MergedEntity(
             name=name,
             title=title,
             entity_type="",
             status=fields.get("status") or fields.get("Status"),
-            fields=dict(fields),
+            fields=fields,
             field_sources=field_sources,
             primary_file=target_file,
             primary_format=fmt,
@@ -208,14 +255,47 @@ class MergeStore:
 
     # --- Internal ---
 
-    def _merge_tree(self, tree: EntityTree, path: Path, mtime: int) -> None:
-        self._merge_entity(tree.entity, path, mtime)
+    def _parse_cached(
+        self,
+        docket_file: DocketFile,
+        layout: DocketLayout,
+        mtime: int,
+    ) -> list[EntityTree] | Entity | None:
+        """Parse a docket file's body, reusing the result for unchanged files.
+
+        A hit needs the same mtime, body text and frontmatter as the cached
+        parse; parsed entities are only read during merging, never mutated.
+        """
+        fm = docket_file.frontmatter
+        fm_key = (layout, fm.docket_type, fm.docket_format)
+        path = docket_file.path
+        body = docket_file.body
+
+        hit = self._parse_cache.get(path)
+        if hit is not None and hit[0] == mtime and hit[2] == fm_key and hit[1] == body:
+            self._parse_cache.move_to_end(path)
+            return hit[3]
+
+        if layout == DocketLayout.OUTLINE:
+            parsed = parse_outline(body, fm, self.status_map)
+        else:
+            # FILE and FOLDER layouts are both one entity per file
+            parsed = parse_file_entity(body, fm, self.status_map)
+
+        self._parse_cache[path] = (mtime, body, fm_key, parsed)
+        self._parse_cache.move_to_end(path)
+        if len(self._parse_cache) > PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return parsed
+
+    def _merge_tree(self, tree: EntityTree, source: FieldSource) -> None:
+        self._merge_entity(tree.entity, source)
 
         parent_name = tree.entity.name
         child_names: list[str] = []
 
         for child in tree.children:
-            self._merge_tree(child, path, mtime)
+            self._merge_tree(child, source)
             child_names.append(child.entity.name)
 
         # Link children to parent
@@ -224,23 +304,27 @@ class MergeStore:
         ]
 
         parent = self.entities.get(parent_name)
-        if parent is not None:
+        if parent is not None and cloned_children:
+            linked = {c.name for c in parent.children}
             for child in cloned_children:
-                if not any(c.name == child.name for c in parent.children):
+                if child.name not in linked:
                     parent.children.append(child)
+                    linked.add(child.name)
 
-    def _merge_entity(self, entity: Entity, path: Path, mtime: int) -> None:
-        source = FieldSource(path=path, modified_ms=mtime)
+    def _merge_entity(self, entity: Entity, source: FieldSource) -> None:
+        path = source.path
+        mtime = source.modified_ms
 
         existing = self.entities.get(entity.name)
         if existing is not None:
             # Merge fields -- most recently modified wins
+            fields = existing.fields
+            field_sources = existing.field_sources
             for key, value in entity.fields.items():
-                existing_source = existing.field_sources.get(key)
-                should_update = existing_source is None or mtime >= existing_source.modified_ms
-                if should_update:
-                    existing.fields[key] = value
-                    existing.field_sources[key] = FieldSource(path=path, modified_ms=mtime)
+                existing_source = field_sources.get(key)
+                if existing_source is None or mtime >= existing_source.modified_ms:
+                    fields[key] = value
+                    field_sources[key] = source
 
             # Update status if newer
             if entity.status is not None:
@@ -248,7 +332,7 @@ class MergeStore:
                 should_update = existing_source is None or mtime >= existing_source.modified_ms
                 if should_update:
                     existing.status = entity.status
-                    existing.field_sources["status"] = FieldSource(path=path, modified_ms=mtime)
+                    existing.field_sources["status"] = source
 
             # Update primary file if this file has more fields
             this_field_count = len(entity.fields) + (1 if entity.status is not None else 0)
@@ -261,11 +345,9 @@ class MergeStore:
                 existing.primary_format = entity.kv_format
         else:
             # New entity
-            field_sources: dict[str, FieldSource] = {}
-            for key in entity.fields:
-                field_sources[key] = FieldSource(path=path, modified_ms=mtime)
+            field_sources = dict.fromkeys(entity.fields, source)
             if entity.status is not None:
-                field_sources["status"] = FieldSource(path=path, modified_ms=mtime)
+                field_sources["status"] = source
 
             merged = MergedEntity(
                 name=entity.name,
@@ -290,75 +372,91 @@ def _update_file_content(
     entities: list[MergedEntity],
     status_map: StatusMap,
 ) -> str:
-    """Update a file's content with modified entity fields."""
+    """Update a file's content with modified entity fields.
+
+    Heading lines are located with a compiled search; text between
+    headings that belong to no entity is copied as a single slice.
+    """
+    text = normalize_newlines(content)
+    if not text.endswith("\n"):
+        text += "\n"
+
+    by_name: dict[str, MergedEntity] = {}
+    for e in entities:
+        by_name.setdefault(e.name, e)
+
     result: list[str] = []
-    lines = content.splitlines()
-    i = 0
-
-    while i < len(lines):
-        line = lines[i]
-        trimmed = line.strip()
-
-        if trimmed.startswith("#"):
-            entity = _find_entity_for_heading(trimmed, entities, status_map)
-            if entity is not None:
-                # Rewrite the heading with updated status
-                level = 0
-                for ch in trimmed:
-                    if ch == "#":
-                        level += 1
-                    else:
-                        break
-                hashes = "#" * level
-
-                if entity.status is not None:
-                    write_form = status_map.write_form(entity.status)
-                    if write_form is not None:
-                        result.append(f"{hashes} {write_form} {entity.name} \u2014 {entity.title}")
-                    else:
-                        result.append(f"{hashes} {entity.name} \u2014 {entity.title}")
-                else:
-                    result.append(f"{hashes} {entity.name} \u2014 {entity.title}")
-
-                i += 1
-
-                # Replace KV lines in the body
-                kv_lines_written = False
-                while i < len(lines):
-                    body_line = lines[i].strip()
-                    # Stop at next heading
-                    if body_line.startswith("#"):
-                        break
-
-                    if _is_kv_line(body_line, entity.primary_format):
-                        if not kv_lines_written:
-                            non_status = {
-                                k: v for k, v in entity.fields.items()
-                                if k.lower() != "status"
-                            }
-                            if non_status:
-                                result.append(serialize_kv(non_status, entity.primary_format))
-                            kv_lines_written = True
-                        i += 1
-                        continue
-
-                    result.append(lines[i])
-                    i += 1
+    append = result.append
+    headings = list(HEADING_LINE_RE.finditer(text))
+    pos = 0
+
+    for idx, m in enumerate(headings):
+        trimmed = m.group().strip()
+        entity = _find_entity_for_heading(trimmed, by_name, status_map)
+        if entity is None:
+            continue
 
+        append(text[pos:m.start()])
+
+        # Rewrite the heading with updated status
+        hashes = "#" * (len(trimmed) - len(trimmed.lstrip("#")))
+        write_form = (
+            status_map.write_form(entity.status) if entity.status is not None else None
+        )
+        if write_form is not None:
+            append(f"{hashes} {write_form} {entity.name} \u2014 {entity.title}\n")
+        else:
+            append(f"{hashes} {entity.name} \u2014 {entity.title}\n")
+
+        # Replace KV lines in the body, which runs up to the next heading
+        # and ends with a newline. Runs of other lines are copied as slices.
+        body_start = m.end() + 1
+        pos = headings[idx + 1].start() if idx + 1 < len(headings) else len(text)
+        fmt = entity.primary_format
+        hint = _KV_LINE_HINTS.get(fmt)
+        kv_lines_written = False
+        run_start = line_start = body_start
+        while line_start < pos:
+            if hint is not None:
+                # Lines without the hint cannot be KV lines; skip to the next one
+                h = text.find(hint, line_start, pos)
+                if h < 0:
+                    break
+                line_start = text.rfind("\n", line_start, h) + 1 or line_start
+            line_end = text.find("\n", line_start, pos)
+            if _is_kv_line(text[line_start:line_end].strip(), fmt):
+                append(text[run_start:line_start])
                 if not kv_lines_written:
-                    non_status = {
-                        k: v for k, v in entity.fields.items()
-                        if k.lower() != "status"
-                    }
-                    if non_status:
-                        result.append(serialize_kv(non_status, entity.primary_format))
+                    _append_kv_block(append, entity)
+                    kv_lines_written = True
+                run_start = line_end + 1
+            line_start = line_end + 1
+        if run_start < pos:
+            append(text[run_start:pos])
 
-                continue
+        if not kv_lines_written:
+            _append_kv_block(append, entity)
+
+    append(text[pos:])
+    return "".join(result)
 
-        result.append(line)
-        i += 1
 
-    return "\n".join(result) + "\n"
+def _append_kv_block(append, entity: MergedEntity) -> None:
+    """Append an entity's serialized non-status fields, if it has any."""
+    non_status = {
+        k: v for k, v in entity.fields.items()
+        if k.lower() != "status"
+    }
+    if non_status:
+        append(serialize_kv(non_status, entity.primary_format) + "\n")
+
+
+# Substring every KV line of a format contains, where there is one.
+_KV_LINE_HINTS: dict[KvFormat, str] = {
+    KvFormat.COLONS: "::",
+    KvFormat.PACKED: "::",
+    KvFormat.TABLE: "|",
+}
 
 
 def _is_kv_line(line: str, fmt: KvFormat) -> bool:
@@ -376,7 +474,7 @@ def _is_kv_line(line: str, fmt: KvFormat) -> bool:
 
 def _find_entity_for_heading(
     heading: str,
-    entities: list[MergedEntity],
+    by_name: dict[str, MergedEntity],
     status_map: StatusMap,
 ) -> MergedEntity | None:
     """Find which entity a heading line belongs to."""
@@ -402,18 +500,14 @@ def _find_entity_for_heading(
         else:
             name = rest.strip()
 
-    for e in entities:
-        if e.name == name:
-            return e
-    return None
+    return by_name.get(name)
 
 
 def _strip_status_prefix(s: str, status_map: StatusMap) -> str:
     """Strip a status representation from the start of a string."""
-    for representations in status_map.forward.values():
-        for repr_str in representations:
-            if s.startswith(repr_str):
-                return s[len(repr_str):].lstrip()
+    matched = status_map.match_prefix(s)
+    if matched is not None:
+        return s[matched[2]:].lstrip()
     return s
 
 
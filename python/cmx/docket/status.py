@@ -5,17 +5,75 @@ Matches Rust skill-docket frontmatter.rs StatusMap exactly.
 
 from __future__ import annotations
 
+import re
+import sys
+from types import MappingProxyType
+from typing import Mapping, Sequence
+
+
+# Shared instance returned by StatusMap.default_map(), built on first use.
+_default_map: StatusMap | None = None
+
 
 class StatusMap:
-    """Bidirectional canonical <-> representation mapping."""
+    """Bidirectional canonical <-> representation mapping.
+
+    ``forward`` and ``reverse`` are plain attributes and may be edited or
+    reassigned. The lookups derived from ``forward`` (write forms and the
+    heading prefix matcher) are rebuilt on the next lookup after it changes.
+    """
 
     def __init__(
         self,
-        forward: dict[str, list[str]],
-        reverse: dict[str, str],
+        forward: Mapping[str, Sequence[str]],
+        reverse: Mapping[str, str],
     ) -> None:
         self.forward = forward
         self.reverse = reverse
+        self._build()
+
+    def _build(self) -> None:
+        """(Re)derive the lookups from the current ``forward``."""
+        forward = self.forward
+        # Copy of forward these lookups were built from; a sequence slice
+        # keeps its type, so an unchanged forward compares equal to it.
+        self._built_from: dict[str, Sequence[str]] = {
+            canonical: reprs[:] for canonical, reprs in forward.items()
+        }
+        # Preferred write form per canonical status (first representation)
+        self._write_forms: dict[str, str] = {
+            canonical: reprs[0] for canonical, reprs in forward.items() if reprs
+        }
+        # Heading prefix matcher: (representation, canonical) pairs in forward
+        # order (first listing wins) and one alternation with a capture group
+        # per pair, so match.lastindex indexes straight into the tuple.
+        seen: dict[str, str] = {}
+        for canonical, representations in forward.items():
+            for r in representations:
+                seen.setdefault(r, canonical)
+        self._prefixes: tuple[tuple[str, str], ...] = tuple(seen.items())
+        self._prefix_re = re.compile(
+            "|".join(f"({re.escape(r)})" for r, _ in self._prefixes)
+        ) if self._prefixes else None
+
+    def _sync(self) -> None:
+        """Rebuild the derived lookups if ``forward`` changed since last built."""
+        if self.forward != self._built_from:
+            self._build()
+
+    def match_prefix(self, s: str) -> tuple[str, str, int] | None:
+        """Match a status representation at the start of ``s``.
+
+        Returns (canonical, representation, end_offset) or None.
+        """
+        self._sync()
+        if self._prefix_re is None:
+            return None
+        m = self._prefix_re.match(s)
+        if m is None:
+            return None
+        repr_str, canonical = self._prefixes[m.lastindex - 1]
+        return canonical, repr_str, m.end()
 
     def canonicalize(self, repr_str: str) -> str | None:
         """Look up canonical status from any representation."""
@@ -23,31 +81,64 @@ class StatusMap:
 
     def write_form(self, canonical: str) -> str | None:
         """Get the preferred write representation for a canonical status."""
-        reprs = self.forward.get(canonical)
-        if reprs and len(reprs) > 0:
-            return reprs[0]
-        return None
+        self._sync()
+        return self._write_forms.get(canonical)
 
     @staticmethod
-    def from_raw(raw: dict[str, list[str]]) -> StatusMap:
-        """Build a StatusMap from a canonical -> representations dict."""
+    def from_raw(raw: Mapping[str, Sequence[str]]) -> StatusMap:
+        """Build a StatusMap from a canonical -> representations dict.
+
+        Canonical names are interned, so every lookup returns the same
+        string object for a status and equal statuses compare by identity.
+        """
+        forward: dict[str, Sequence[str]] = {}
         reverse: dict[str, str] = {}
         for canonical, representations in raw.items():
+            canonical = sys.intern(canonical)
+            forward[canonical] = representations
             for r in representations:
                 reverse[r] = canonical
             # Also map the canonical name to itself
             reverse[canonical] = canonical
-        return StatusMap(forward=dict(raw), reverse=reverse)
+        return StatusMap(forward=forward, reverse=reverse)
 
     @staticmethod
     def default_map() -> StatusMap:
-        """Build the default status map matching Rust defaults."""
-        forward: dict[str, list[str]] = {
-            "complete": ["\u2705", "[x]", "DONE"],
-            "in_progress": ["\U0001f504", "[~]", "WIP"],
-            "pending": ["\u23f3", "[ ]", "TODO"],
-            "blocked": ["\U0001f6ab", "[!]", "BLOCKED"],
-            "failed": ["\u274c", "[F]", "FAILED"],
-            "cancelled": ["\u2298", "[-]", "CANCELLED"],
-        }
-        return StatusMap.from_raw(forward)
+        """Return the default status map matching Rust defaults.
+
+        The map is built once and shared, so its mappings are read-only all
+        the way down: forward holds tuples, both mappings are wrapped in
+        read-only proxies, and neither attribute can be reassigned.
+        """
+        global _default_map
+        if _default_map is None:
+            forward: dict[str, tuple[str, ...]] = {
+                "complete": ("\u2705", "[x]", "DONE"),
+                "in_progress": ("\U0001f504", "[~]", "WIP"),
+                "pending": ("\u23f3", "[ ]", "TODO"),
+                "blocked": ("\U0001f6ab", "[!]", "BLOCKED"),
+                "failed": ("\u274c", "[F]", "FAILED"),
+                "cancelled": ("\u2298", "[-]", "CANCELLED"),
+            }
+            raw = StatusMap.from_raw(forward)
+            _default_map = _FrozenStatusMap(
+                MappingProxyType(raw.forward), MappingProxyType(raw.reverse)
+            )
+        return _default_map
+
+
+class _FrozenStatusMap(StatusMap):
+    """The shared default map: forward and reverse cannot be reassigned."""
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name in ("forward", "reverse") and hasattr(self, name):
+            raise AttributeError(f"the default StatusMap's {name} is read-only")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if name in ("forward", "reverse"):
+            raise AttributeError(f"the default StatusMap's {name} is read-only")
+        super().__delattr__(name)
+
+    def _sync(self) -> None:
+        pass  # forward cannot change, so the derived lookups never go stale
@@ -14,9 +14,13 @@ Matches Rust skill-docket trigger/parser.rs exactly.
 
 from __future__ import annotations
 
+import functools
+import re
 from dataclasses import dataclass, field
 from enum import Enum
 
+from ._compat import DATACLASS_SLOTS
+
 
 class CompareOp(Enum):
     GT = ">"
@@ -26,7 +30,11 @@ class CompareOp(Enum):
     EQ = "=="
 
 
-@dataclass
+# Operator token -> CompareOp, resolved once instead of per comparison.
+_COMPARE_OPS: dict[str, CompareOp] = {op.value: op for op in CompareOp}
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Condition:
     """Discriminated union via kind field.
 
@@ -44,22 +52,29 @@ class Condition:
     right: Condition | None = None
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TriggerAction:
     command_template: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TriggerClause:
     condition: Condition
     action: TriggerAction = field(default_factory=TriggerAction)
     is_else: bool = False
 
 
-@dataclass
+# Placeholder action for a clause whose ``then`` line has not been read yet,
+# and the condition of every ``else`` clause. Both are frozen, so one
+# instance of each serves every clause.
+_NO_ACTION = TriggerAction()
+_ALWAYS = Condition(kind="always")
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TriggerBlock:
     name: str | None = None
-    clauses: list[TriggerClause] = field(default_factory=list)
+    clauses: tuple[TriggerClause, ...] = ()
 
 
 # ---------------------------------------------------------------------------
@@ -72,10 +87,21 @@ def parse_triggers(text: str) -> list[TriggerBlock]:
     Each block starts with an ``if`` line and may include ``elif`` and ``else`` lines.
     Action lines start with ``then``. Blocks are separated by blank lines or
     new ``if`` lines.
+
+    Parses are memoized by text, so reloading an unchanged trigger section
+    skips the parser. The blocks are frozen and shared between callers.
     """
+    return list(_parse_triggers_cached(text))
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_triggers_cached(text: str) -> tuple[TriggerBlock, ...]:
+    """Parse trigger blocks; the body of parse_triggers."""
     blocks: list[TriggerBlock] = []
     current_clauses: list[TriggerClause] = []
     current_name: str | None = None
+    # Whether current_clauses holds a non-else clause
+    has_if = False
 
     for raw_line in text.splitlines():
         line = raw_line.strip()
@@ -83,69 +109,85 @@ def parse_triggers(text: str) -> list[TriggerBlock]:
         if not line:
             # Blank line: flush current block if any
             if current_clauses:
-                blocks.append(TriggerBlock(name=current_name, clauses=list(current_clauses)))
-                current_clauses.clear()
+                blocks.append(TriggerBlock(name=current_name, clauses=tuple(current_clauses)))
+                current_clauses = []
+                has_if = False
                 current_name = None
             continue
 
         # Lines starting with '#' are block names
-        if line.startswith("#"):
+        if line[0] == "#":
             # Flush previous block
             if current_clauses:
-                blocks.append(TriggerBlock(name=current_name, clauses=list(current_clauses)))
-                current_clauses.clear()
+                blocks.append(TriggerBlock(name=current_name, clauses=tuple(current_clauses)))
+                current_clauses = []
+                has_if = False
             current_name = line.lstrip("#").strip()
             continue
 
-        if line.startswith("if "):
+        # Classify by the leading keyword: one split instead of a
+        # startswith() test per keyword
+        keyword, sep, rest = line.partition(" ")
+
+        if keyword == "if" and sep:
             # New block if we already have an if clause
-            has_if = any(not c.is_else for c in current_clauses)
-            if current_clauses and has_if:
-                blocks.append(TriggerBlock(name=current_name, clauses=list(current_clauses)))
-                current_clauses.clear()
+            if has_if:
+                blocks.append(TriggerBlock(name=current_name, clauses=tuple(current_clauses)))
+                current_clauses = []
                 current_name = None
 
-            cond_str = line[3:]
-            condition = _parse_condition(cond_str)
+            condition = _parse_condition(rest)
             current_clauses.append(TriggerClause(
                 condition=condition,
-                action=TriggerAction(),
+                action=_NO_ACTION,
                 is_else=False,
             ))
-        elif line.startswith("elif "):
-            cond_str = line[5:]
-            condition = _parse_condition(cond_str)
+            has_if = True
+        elif keyword == "elif" and sep:
+            condition = _parse_condition(rest)
             current_clauses.append(TriggerClause(
                 condition=condition,
-                action=TriggerAction(),
+                action=_NO_ACTION,
                 is_else=False,
             ))
+            has_if = True
         elif line == "else":
             current_clauses.append(TriggerClause(
-                condition=Condition(kind="always"),
-                action=TriggerAction(),
+                condition=_ALWAYS,
+                action=_NO_ACTION,
                 is_else=True,
             ))
-        elif line.startswith("then "):
-            cmd = line[5:].strip()
+        elif keyword == "then" and sep:
+            cmd = rest.lstrip()  # line is already stripped on the right
             if current_clauses:
-                current_clauses[-1].action.command_template = cmd
+                # Clauses are frozen; the action replaces the clause's last one
+                clause = current_clauses[-1]
+                current_clauses[-1] = TriggerClause(
+                    condition=clause.condition,
+                    action=TriggerAction(command_template=cmd),
+                    is_else=clause.is_else,
+                )
             else:
                 raise ValueError("'then' without preceding condition")
 
     # Flush remaining block
     if current_clauses:
-        blocks.append(TriggerBlock(name=current_name, clauses=list(current_clauses)))
+        blocks.append(TriggerBlock(name=current_name, clauses=tuple(current_clauses)))
 
-    return blocks
+    return tuple(blocks)
 
 
 # ---------------------------------------------------------------------------
 # Condition parser
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1024)
 def _parse_condition(expr: str) -> Condition:
-    """Parse a single condition expression."""
+    """Parse a single condition expression.
+
+    Conditions are frozen, so one parse serves every clause that repeats
+    the expression.
+    """
     trimmed = expr.strip()
 
     # Handle "and" conjunction
@@ -157,25 +199,12 @@ def _parse_condition(expr: str) -> Condition:
         right = _parse_condition(right_str)
         return Condition(kind="and", left=left, right=right)
 
-    # contains({agent}, "pattern")
-    if trimmed.startswith("contains("):
-        return _parse_contains(trimmed)
-
-    # status({agent}) == state
-    if trimmed.startswith("status("):
-        return _parse_status(trimmed)
-
-    # idle({agent}, N)
-    if trimmed.startswith("idle("):
-        return _parse_idle(trimmed)
-
-    # context({agent}) > N%
-    if trimmed.startswith("context("):
-        return _parse_context(trimmed)
-
-    # heartbeat N
-    if trimmed.startswith("heartbeat "):
-        return _parse_heartbeat(trimmed)
+    # Dispatch on the head token up to and including the first "(" or " "
+    m = _CONDITION_HEAD_RE.match(trimmed)
+    if m is not None:
+        parse = _CONDITION_PARSERS.get(m.group())
+        if parse is not None:
+            return parse(trimmed)
 
     raise ValueError(f"Unknown condition: '{trimmed}'")
 
@@ -184,20 +213,31 @@ def _find_and_split(s: str) -> int | None:
     """Find the position of ' and ' for splitting conjunctions.
 
     Respects parentheses and quotes to avoid splitting inside them.
+    Candidates are located with str.find; between candidates only the
+    quote and paren characters are visited to carry the nesting state.
     """
+    pos = s.find(" and ")
+    if pos < 0:
+        return None
+
     paren_depth = 0
     in_quote = False
-
-    for i, ch in enumerate(s):
-        if ch == '"':
-            in_quote = not in_quote
-        elif not in_quote:
-            if ch == '(':
-                paren_depth += 1
-            elif ch == ')':
-                paren_depth = max(0, paren_depth - 1)
-            elif paren_depth == 0 and s[i:i + 5] == " and ":
-                return i
+    scanned = 0
+
+    while pos >= 0:
+        for m in _NESTING_CHAR_RE.finditer(s, scanned, pos):
+            ch = m.group()
+            if ch == '"':
+                in_quote = not in_quote
+            elif not in_quote:
+                if ch == '(':
+                    paren_depth += 1
+                else:
+                    paren_depth = max(0, paren_depth - 1)
+        if not in_quote and paren_depth == 0:
+            return pos
+        scanned = pos
+        pos = s.find(" and ", pos + 1)
     return None
 
 
@@ -269,23 +309,15 @@ def _parse_context(s: str) -> Condition:
     agent = s[8:close].strip()  # "context(" is 8 chars
     after = s[close + 1:].strip()
 
-    if after.startswith(">="):
-        op = CompareOp.GTE
-        rest = after[2:]
-    elif after.startswith("<="):
-        op = CompareOp.LTE
-        rest = after[2:]
-    elif after.startswith(">"):
-        op = CompareOp.GT
-        rest = after[1:]
-    elif after.startswith("<"):
-        op = CompareOp.LT
-        rest = after[1:]
-    elif after.startswith("=="):
-        op = CompareOp.EQ
+    # Two-character operators first, so ">=" is not read as ">"
+    op = _COMPARE_OPS.get(after[:2])
+    if op is not None:
         rest = after[2:]
     else:
-        raise ValueError(f"Expected comparison operator after context({agent}), got '{after}'")
+        op = _COMPARE_OPS.get(after[:1])
+        if op is None:
+            raise ValueError(f"Expected comparison operator after context({agent}), got '{after}'")
+        rest = after[1:]
 
     pct_str = rest.strip().rstrip("%")
     try:
@@ -304,3 +336,18 @@ def _parse_heartbeat(s: str) -> Condition:
     except ValueError:
         raise ValueError(f"Invalid seconds in heartbeat: '{num_str}'")
     return Condition(kind="heartbeat", seconds=seconds)
+
+
+# Condition head (``contains(``, ``heartbeat `` ...) -> parser.
+_CONDITION_PARSERS = {
+    "contains(": _parse_contains,      # contains({agent}, "pattern")
+    "status(": _parse_status,          # status({agent}) == state
+    "idle(": _parse_idle,              # idle({agent}, N)
+    "context(": _parse_context,        # context({agent}) > N%
+    "heartbeat ": _parse_heartbeat,    # heartbeat N
+}
+
+_CONDITION_HEAD_RE = re.compile(r"[^( ]*[( ]")
+
+# Characters that change quote/paren nesting in _find_and_split.
+_NESTING_CHAR_RE = re.compile(r'["()]')
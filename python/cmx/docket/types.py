@@ -3,9 +3,20 @@
 from __future__ import annotations
 
 import json
+import json.decoder
+import json.scanner
+import re
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 
+from ._compat import DATACLASS_SLOTS
+
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install cmx[fast]
+    orjson = None
+
 
 class TaskStatus(Enum):
     PENDING = "pending"
@@ -22,7 +33,18 @@ class TaskSource(Enum):
     BOTH = "both"
 
 
-@dataclass
+# Wire value -> enum member, looked up directly instead of via Enum.__call__.
+_STATUS_BY_VALUE = {s.value: s for s in TaskStatus}
+_SOURCE_BY_VALUE = {s.value: s for s in TaskSource}
+
+
+def _member(by_value: dict, enum_cls: type, value):
+    """Enum member for a wire value; the Enum call raises for unknown ones."""
+    member = by_value.get(value) if isinstance(value, str) else None
+    return member if member is not None else enum_cls(value)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TaskNode:
     id: str
     title: str
@@ -34,38 +56,285 @@ class TaskNode:
     spec_path: str | None = None
 
     def to_dict(self) -> dict:
-        """Serialize to dict matching Rust serde JSON output."""
-        d: dict = {
+        """Serialize to dict matching Rust serde JSON output.
+
+        Walks the tree with an explicit stack, so depth is not bounded by
+        the recursion limit.
+        """
+        root = self._node_dict()
+        stack = [(self, root)]
+        while stack:
+            node, d = stack.pop()
+            out = d["children"]
+            for child in node.children:
+                child_d = child._node_dict()
+                out.append(child_d)
+                stack.append((child, child_d))
+        return root
+
+    def to_dict_flat(self) -> dict:
+        """Serialize the tree as columns, one row per node in pre-order.
+
+        Keys are the serde field names (without ``children``) plus
+        ``parent``, the row index of each node's parent (-1 for this node).
+        Consumers that only need a table skip rebuilding the tree.
+        """
+        ids: list[str] = []
+        titles: list[str] = []
+        sources: list[str] = []
+        statuses: list[str] = []
+        results: list[str | None] = []
+        agents: list[str | None] = []
+        spec_paths: list[str | None] = []
+        parents: list[int] = []
+        stack = [(self, -1)]
+        while stack:
+            node, parent = stack.pop()
+            row = len(ids)
+            ids.append(node.id)
+            titles.append(node.title)
+            sources.append(node.source.value)
+            statuses.append(node.status.value)
+            results.append(node.result)
+            agents.append(node.agent)
+            spec_paths.append(node.spec_path)
+            parents.append(parent)
+            # Reversed, so the first child is popped (and numbered) first
+            for child in reversed(node.children):
+                stack.append((child, row))
+        return {
+            "id": ids,
+            "title": titles,
+            "source": sources,
+            "status": statuses,
+            "result": results,
+            "agent": agents,
+            "spec_path": spec_paths,
+            "parent": parents,
+        }
+
+    def _node_dict(self) -> dict:
+        """This node's serde dict, with an empty children list."""
+        return {
             "id": self.id,
             "title": self.title,
             "source": self.source.value,
             "status": self.status.value,
             "result": self.result,
             "agent": self.agent,
-            "children": [c.to_dict() for c in self.children],
+            "children": [],
             "spec_path": self.spec_path,
         }
-        return d
 
     def to_json(self) -> str:
-        """Serialize to JSON string matching Rust serde output."""
-        return json.dumps(self.to_dict(), separators=(",", ":"))
+        """Serialize to JSON string matching Rust serde output.
+
+        Like serde_json, non-ASCII text is written as-is rather than escaped,
+        so both JSON backends produce the same string. orjson serializes the
+        dataclass tree directly (fields in declaration order, enums by
+        value), without building the intermediate to_dict() tree.
+
+        Trees nested deeper than either encoder allows (orjson stops at
+        about 255 levels, json at the recursion limit) are written by an
+        iterative encoder that produces the same string.
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(self).decode("utf-8")
+            except orjson.JSONEncodeError:
+                return _dumps_deep(self)
+        try:
+            return json.dumps(self.to_dict(), separators=(",", ":"), ensure_ascii=False)
+        except RecursionError:
+            return _dumps_deep(self)
 
     @classmethod
     def from_dict(cls, d: dict) -> TaskNode:
-        """Deserialize from dict matching Rust serde JSON output."""
+        """Deserialize from dict matching Rust serde JSON output.
+
+        Like to_dict(), builds the tree iteratively.
+        """
+        from_node_dict = cls._from_node_dict
+        root = from_node_dict(d)
+        stack = [(root, d)]
+        while stack:
+            node, data = stack.pop()
+            children = node.children
+            for child_d in data.get("children", []):
+                child = from_node_dict(child_d)
+                children.append(child)
+                stack.append((child, child_d))
+        return root
+
+    @classmethod
+    def _from_node_dict(cls, d: dict) -> TaskNode:
+        """Build one node from its serde dict, without its children."""
+        # Agent names recur across a tree; share one string per name
+        agent = d.get("agent")
+        if isinstance(agent, str):
+            agent = sys.intern(agent)
+        # Positional, in field order: keyword binding costs more than the
+        # rest of the construction on this per-node path
         return cls(
-            id=d["id"],
-            title=d["title"],
-            source=TaskSource(d["source"]),
-            status=TaskStatus(d["status"]),
-            result=d.get("result"),
-            agent=d.get("agent"),
-            children=[cls.from_dict(c) for c in d.get("children", [])],
-            spec_path=d.get("spec_path"),
+            d["id"],
+            d["title"],
+            _member(_SOURCE_BY_VALUE, TaskSource, d["source"]),
+            _member(_STATUS_BY_VALUE, TaskStatus, d["status"]),
+            d.get("result"),
+            agent,
+            [],
+            d.get("spec_path"),
         )
 
     @classmethod
     def from_json(cls, s: str) -> TaskNode:
-        """Deserialize from JSON string."""
-        return cls.from_dict(json.loads(s))
+        """Deserialize from JSON string.
+
+        Like to_json, documents nested too deeply for the JSON backend are
+        parsed again with an explicit stack rather than failing.
+        """
+        if orjson is not None:
+            try:
+                return cls.from_dict(orjson.loads(s))
+            except orjson.JSONDecodeError:
+                pass  # possibly just too deep; _loads_deep reports real errors
+        else:
+            try:
+                return cls.from_dict(json.loads(s))
+            except RecursionError:
+                pass
+        return cls.from_dict(_loads_deep(s))
+
+
+# ---------------------------------------------------------------------------
+# Deep-tree JSON
+# ---------------------------------------------------------------------------
+
+_encode_str = json.encoder.encode_basestring  # no ASCII escaping, like serde
+
+
+def _json_value(v) -> str:
+    """A scalar field as compact JSON, escaped like json.dumps(ensure_ascii=False)."""
+    if v is None:
+        return "null"
+    if isinstance(v, str):
+        return _encode_str(v)
+    return json.dumps(v, separators=(",", ":"), ensure_ascii=False)
+
+
+def _dumps_deep(root: TaskNode) -> str:
+    """TaskNode.to_json output, written with an explicit stack.
+
+    Each node is written up to its ``"children":[`` on the way down; the
+    rest of the object is written once its last child is done.
+    """
+    parts: list[str] = []
+    append = parts.append
+    # [remaining children, text closing the node, next child is the first]
+    stack: list[list] = []
+    node = root
+    while True:
+        if node is not None:
+            append('{"id":' + _json_value(node.id)
+                   + ',"title":' + _json_value(node.title)
+                   + ',"source":' + _json_value(node.source.value)
+                   + ',"status":' + _json_value(node.status.value)
+                   + ',"result":' + _json_value(node.result)
+                   + ',"agent":' + _json_value(node.agent)
+                   + ',"children":[')
+            stack.append([iter(node.children),
+                          '],"spec_path":' + _json_value(node.spec_path) + "}",
+                          True])
+        top = stack[-1]
+        node = next(top[0], None)
+        if node is None:
+            append(top[1])
+            stack.pop()
+            if not stack:
+                return "".join(parts)
+        elif top[2]:
+            top[2] = False
+        else:
+            append(",")
+
+
+_scan_str = json.decoder.scanstring
+_ws = re.compile(r"[ \t\n\r]*").match
+
+
+def _scan_key(s: str, pos: int) -> tuple[str, int]:
+    """Parse ``"key":`` at *pos*; return the key and the position of its value."""
+    if s[pos:pos + 1] != '"':
+        raise json.JSONDecodeError(
+            "Expecting property name enclosed in double quotes", s, pos)
+    key, pos = _scan_str(s, pos + 1)
+    pos = _ws(s, pos).end()
+    if s[pos:pos + 1] != ":":
+        raise json.JSONDecodeError("Expecting ':' delimiter", s, pos)
+    return key, _ws(s, pos + 1).end()
+
+
+def _loads_deep(s: str):
+    """json.loads with an explicit stack, for documents of any depth.
+
+    Open containers live on ``stack`` as ``[container, pending key]``;
+    each finished value is attached to the top, closing containers as
+    their ``}``/``]`` is reached.
+    """
+    stack: list[list] = []
+    pos = _ws(s, 0).end()
+    while True:
+        ch = s[pos:pos + 1]
+        if ch == "{":
+            pos = _ws(s, pos + 1).end()
+            if s[pos:pos + 1] != "}":
+                key, pos = _scan_key(s, pos)
+                stack.append([{}, key])
+                continue
+            value, pos = {}, pos + 1
+        elif ch == "[":
+            pos = _ws(s, pos + 1).end()
+            if s[pos:pos + 1] != "]":
+                stack.append([[], None])
+                continue
+            value, pos = [], pos + 1
+        elif ch == '"':
+            value, pos = _scan_str(s, pos + 1)
+        elif s.startswith("null", pos):
+            value, pos = None, pos + 4
+        elif s.startswith("true", pos):
+            value, pos = True, pos + 4
+        elif s.startswith("false", pos):
+            value, pos = False, pos + 5
+        else:
+            m = json.scanner.NUMBER_RE.match(s, pos)
+            if m is None:
+                raise json.JSONDecodeError("Expecting value", s, pos)
+            integer, frac, exp = m.groups()
+            value = (float(integer + (frac or "") + (exp or ""))
+                     if frac or exp else int(integer))
+            pos = m.end()
+
+        while True:
+            pos = _ws(s, pos).end()
+            if not stack:
+                if pos != len(s):
+                    raise json.JSONDecodeError("Extra data", s, pos)
+                return value
+            top = stack[-1]
+            container = top[0]
+            is_obj = isinstance(container, dict)
+            if is_obj:
+                container[top[1]] = value
+            else:
+                container.append(value)
+            ch = s[pos:pos + 1]
+            if ch == ",":
+                pos = _ws(s, pos + 1).end()
+                if is_obj:
+                    top[1], pos = _scan_key(s, pos)
+                break
+            if ch != ("}" if is_obj else "]"):
+                raise json.JSONDecodeError("Expecting ',' delimiter", s, pos)
+            stack.pop()
+            value, pos = container, pos + 1
@@ -7,20 +7,45 @@ followed by that many bytes of JSON payload. Max frame size is 16 MiB.
 import json
 import struct
 import socket
-from typing import Any, Optional
+from typing import Any, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install cmx[fast]
+    orjson = None
 
 
 # Maximum frame size matches Rust side (16 MiB).
 MAX_FRAME_SIZE = 16 * 1024 * 1024
 
+# Frame length prefix: 4-byte big-endian u32, compiled once.
+_LENGTH_PREFIX = struct.Struct('>I')
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass  # e.g. non-str keys or >64-bit ints; stdlib handles these
+    return json.dumps(obj).encode('utf-8')
+
+
+def _loads(data: Union[bytes, bytearray]) -> Any:
+    """Parse JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def encode_request(command: dict) -> bytes:
     """Encode a command dict as length-prefixed JSON.
 
     Returns 4-byte big-endian length prefix + UTF-8 JSON payload.
     """
-    payload = json.dumps(command).encode('utf-8')
-    return struct.pack('>I', len(payload)) + payload
+    payload = _dumps(command)
+    return _LENGTH_PREFIX.pack(len(payload)) + payload
 
 
 def decode_response(data: bytes) -> dict:
@@ -31,30 +56,65 @@ def decode_response(data: bytes) -> dict:
     """
     if len(data) < 4:
         raise ValueError("Response too short: need at least 4 bytes for length prefix")
-    length = struct.unpack('>I', data[:4])[0]
+    length = _LENGTH_PREFIX.unpack_from(data)[0]
     if len(data) < 4 + length:
         raise ValueError(f"Response truncated: expected {length} bytes, got {len(data) - 4}")
-    payload = data[4:4 + length]
-    return json.loads(payload)
+    if orjson is not None:
+        # orjson parses a view in place; json.loads needs its own copy
+        return orjson.loads(memoryview(data)[4:4 + length])
+    return json.loads(data[4:4 + length])
+
+
+# Socket buffer size requested for the persistent connection (1 MiB).
+SOCKET_BUFFER_SIZE = 1 << 20
+
+# Bytes requested per recv() when refilling the read buffer.
+RECV_CHUNK_SIZE = 64 * 1024
+
 
+# Payloads at least this large are sent with the length prefix as a
+# separate sendmsg() buffer instead of being copied into one frame.
+SCATTER_MIN_PAYLOAD = 64 * 1024
 
-def _recv_exact(sock: socket.socket, n: int) -> bytes:
-    """Read exactly n bytes from a socket."""
-    buf = bytearray()
-    while len(buf) < n:
-        chunk = sock.recv(n - len(buf))
-        if not chunk:
-            raise ConnectionError("Socket closed before all data received")
-        buf.extend(chunk)
-    return bytes(buf)
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+
+def _send_buffers(sock: socket.socket, buffers, progress: List[int]) -> None:
+    """Send every buffer in order, like sendall() across several buffers.
+
+    ``progress[0]`` is advanced by every byte the kernel accepts, so a
+    caller can tell after an error whether anything went out.
+    """
+    views = [memoryview(b) for b in buffers if b]
+    while views:
+        if len(views) == 1:
+            sent = sock.send(views[0])
+        else:
+            sent = sock.sendmsg(views)
+        progress[0] += sent
+        # Drop fully sent buffers and trim a partially sent one
+        while sent:
+            head = views[0]
+            if sent >= len(head):
+                sent -= len(head)
+                del views[0]
+            else:
+                views[0] = head[sent:]
+                sent = 0
 
 
 class SocketConnection:
-    """Manages a Unix domain socket connection to cmx.sock."""
+    """Manages a Unix domain socket connection to cmx.sock.
+
+    The connection is opened lazily and kept for the life of the object.
+    Reads go through an internal buffer so several response frames can be
+    served from a single ``recv``.
+    """
 
     def __init__(self, path: str = None):
         self.path = path or self._default_path()
         self._sock: Optional[socket.socket] = None
+        self._rbuf = bytearray()
 
     def _default_path(self) -> str:
         """Default socket path: ~/.config/cmx/cmx.sock"""
@@ -65,32 +125,141 @@ class SocketConnection:
         """Connect to the daemon socket."""
         if self._sock is not None:
             return
-        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        self._sock.connect(self.path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+        except OSError:
+            pass  # Buffer sizing is advisory; keep the kernel defaults
+        try:
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        self._rbuf.clear()
 
-    def send(self, command: dict) -> dict:
-        """Send a command and receive the response.
+    def _write(self, *buffers: bytes) -> None:
+        """Write request buffers, reconnecting once if the socket went stale.
 
-        Automatically connects if not already connected.
-        Returns the parsed response dict.
+        Several buffers go out scatter-gather through ``sendmsg`` without
+        being concatenated first.
+
+        The write is retried on a new connection only if not a single byte
+        reached the old one, so the daemon cannot have seen any of the
+        request. Once part of it went out (in a batch, whole frames may
+        already have been applied), the error is raised instead.
         """
         if self._sock is None:
             self.connect()
+        progress = [0]
+        try:
+            _send_buffers(self._sock, buffers, progress)
+        except OSError:
+            self.close()
+            if progress[0]:
+                raise
+            self.connect()
+            _send_buffers(self._sock, buffers, progress)
+
+    def _fill(self, n: int) -> None:
+        """Refill the read buffer until it holds at least n bytes."""
+        buf = self._rbuf
+        while len(buf) < n:
+            chunk = self._sock.recv(max(RECV_CHUNK_SIZE, n - len(buf)))
+            if not chunk:
+                self.close()
+                raise ConnectionError("Socket closed before all data received")
+            buf.extend(chunk)
+
+    def _read_payload(self, n: int) -> bytearray:
+        """Read exactly n payload bytes.
+
+        A payload already buffered (or nearly so) is sliced out of the read
+        buffer. A large remainder is received straight into a preallocated
+        bytearray with ``recv_into``, skipping the staging copy.
+        """
+        buf = self._rbuf
+        missing = n - len(buf)
+        if missing < RECV_CHUNK_SIZE:
+            if missing > 0:
+                self._fill(n)
+            data = buf[:n]
+            del buf[:n]
+            return data
 
-        # Send length-prefixed JSON
-        frame = encode_request(command)
-        self._sock.sendall(frame)
+        data = bytearray(n)
+        have = len(buf)
+        data[:have] = buf
+        buf.clear()
+        view = memoryview(data)
+        while have < n:
+            got = self._sock.recv_into(view[have:])
+            if not got:
+                self.close()
+                raise ConnectionError("Socket closed before all data received")
+            have += got
+        return data
 
-        # Read 4-byte length prefix
-        len_bytes = _recv_exact(self._sock, 4)
-        length = struct.unpack('>I', len_bytes)[0]
+    def _read_frame(self) -> dict:
+        """Read one length-prefixed JSON response frame."""
+        buf = self._rbuf
+        if len(buf) < 4:
+            self._fill(4)
+        length = _LENGTH_PREFIX.unpack_from(buf)[0]
+        del buf[:4]
 
         if length > MAX_FRAME_SIZE:
             raise ValueError(f"Response frame too large: {length} bytes")
 
-        # Read payload
-        payload = _recv_exact(self._sock, length)
-        return json.loads(payload)
+        return _loads(self._read_payload(length))
+
+    def send(self, command: dict) -> dict:
+        """Send a command and receive the response.
+
+        Automatically connects if not already connected.
+        Returns the parsed response dict.
+        """
+        payload = _dumps(command)
+        prefix = _LENGTH_PREFIX.pack(len(payload))
+        if len(payload) >= SCATTER_MIN_PAYLOAD and _HAS_SENDMSG:
+            # Large payload: send prefix and payload without joining them
+            self._write(prefix, payload)
+        else:
+            self._write(prefix + payload)
+        return self._read_responses(1)[0]
+
+    def send_many(self, commands: List[dict]) -> List[dict]:
+        """Send several commands in one write and receive all responses.
+
+        Frames are concatenated into a single buffer so the whole batch
+        costs one ``sendall``; responses are read back in request order.
+        Returns the list of parsed response dicts.
+        """
+        if not commands:
+            return []
+        # Join prefixes and payloads in one pass so each payload is copied
+        # once, rather than once per frame and again for the batch
+        parts = []
+        for cmd in commands:
+            payload = _dumps(cmd)
+            parts.append(_LENGTH_PREFIX.pack(len(payload)))
+            parts.append(payload)
+        self._write(b"".join(parts))
+        return self._read_responses(len(commands))
+
+    def _read_responses(self, n: int) -> List[dict]:
+        """Read the n response frames of a request that was just written.
+
+        If reading fails partway (bad JSON, oversized frame, interrupt),
+        the remaining frames would be handed to later requests as their
+        responses, so the connection is dropped before re-raising.
+        """
+        try:
+            return [self._read_frame() for _ in range(n)]
+        except BaseException:
+            self.close()
+            raise
 
     def close(self):
         """Close the socket connection."""
@@ -100,6 +269,7 @@ class SocketConnection:
             except OSError:
                 pass
             self._sock = None
+        self._rbuf.clear()
 
     def __enter__(self):
         self.connect()
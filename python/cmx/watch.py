@@ -1,21 +1,36 @@
 """Reactive watch -- fire callbacks when state changes match patterns."""
 
+import functools
 import re
 import threading
-import time
-from typing import Callable, Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Sequence, Tuple
+
+from .client import CmxClient
 
 # Matches $variable_name in patterns (word chars after a $)
 _VAR_RE = re.compile(r'\$(\w+)')
 
+# Growth of the poll delay after each poll in which no watch fired.
+_BACKOFF_FACTOR = 1.5
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_vars(pattern: str) -> Tuple[str, ...]:
+    """Variable names in a pattern, memoized for re-registered patterns."""
+    if "$" not in pattern:
+        return ()
+    return tuple(_VAR_RE.findall(pattern))
+
 
 class WatchEntry:
     """A registered watch."""
 
-    def __init__(self, pattern: str, callback: Callable, variables: List[str]):
+    __slots__ = ("pattern", "callback", "variables")
+
+    def __init__(self, pattern: str, callback: Callable, variables: Sequence[str]):
         self.pattern = pattern
         self.callback = callback
-        self.variables = variables
+        self.variables: Tuple[str, ...] = tuple(variables)
 
 
 class WatchManager:
@@ -29,9 +44,13 @@ class WatchManager:
     def __init__(self, client):
         self._client = client
         self._watches: List[WatchEntry] = []
+        # Live watches by index; poll_once skips unwatched tombstones
+        self._active: Dict[int, WatchEntry] = {}
         self._snapshots: Dict[int, Any] = {}
         self._poll_thread: Optional[threading.Thread] = None
         self._running = False
+        # Set by stop(); the poll loop waits on it so it wakes immediately
+        self._stop_event = threading.Event()
         self._lock = threading.Lock()
 
     def watch(self, pattern: str, callback: Callable) -> int:
@@ -40,11 +59,11 @@ class WatchManager:
         The callback receives bound variables as keyword arguments.
         Returns the watch index.
         """
-        variables = _VAR_RE.findall(pattern)
-        entry = WatchEntry(pattern, callback, variables)
+        entry = WatchEntry(pattern, callback, _extract_vars(pattern))
         with self._lock:
             idx = len(self._watches)
             self._watches.append(entry)
+            self._active[idx] = entry
             self._snapshots[idx] = None
         return idx
 
@@ -53,59 +72,112 @@ class WatchManager:
         with self._lock:
             if 0 <= index < len(self._watches):
                 self._watches[index] = None
+                self._active.pop(index, None)
                 self._snapshots.pop(index, None)
 
-    def start(self, poll_interval: float = 0.5) -> None:
-        """Start polling for changes in a background thread."""
+    def start(self, poll_interval: float = 0.5,
+              max_interval: Optional[float] = None) -> None:
+        """Start polling for changes in a background thread.
+
+        Polls every ``poll_interval`` seconds. Passing ``max_interval``
+        opts into backoff: each poll that fires nothing then stretches the
+        wait by half, up to ``max_interval``, and a firing poll resets it.
+        """
         if self._running:
             return
         self._running = True
+        self._stop_event.clear()
         self._poll_thread = threading.Thread(
-            target=self._poll_loop, args=(poll_interval,), daemon=True
+            target=self._poll_loop,
+            args=(poll_interval, poll_interval if max_interval is None
+                  else max(poll_interval, max_interval)),
+            daemon=True,
         )
         self._poll_thread.start()
 
     def stop(self) -> None:
         """Stop the polling thread."""
         self._running = False
+        self._stop_event.set()
         if self._poll_thread is not None:
             self._poll_thread.join(timeout=5.0)
             self._poll_thread = None
 
-    def _poll_loop(self, interval: float) -> None:
-        """Background polling loop."""
+    def _poll_loop(self, interval: float, max_interval: float) -> None:
+        """Background polling loop, backing off while nothing changes."""
+        delay = interval
         while self._running:
             try:
-                self.poll_once()
+                fired = self.poll_once()
             except Exception:
-                pass
-            time.sleep(interval)
+                fired = None
+            if fired:
+                delay = interval
+            else:
+                delay = min(delay * _BACKOFF_FACTOR, max_interval)
+            if self._stop_event.wait(delay):
+                break
 
     def poll_once(self) -> List[Dict[str, Any]]:
         """Check for changes once and fire matching callbacks.
 
+        All watched values are read before any callback runs, so a change
+        made by a callback is seen on the next poll.
+
         Returns list of fired watch results.
         """
         fired = []
         with self._lock:
-            watches = list(enumerate(self._watches))
+            watches = list(self._active.items())
 
-        for idx, entry in watches:
-            if entry is None:
-                continue
+        currents = self._fetch([entry.pattern for _, entry in watches])
+
+        # Diff every watch against its snapshot in one locked pass. Watches
+        # removed since the fetch have no snapshot and are skipped, so an
+        # unwatch() never has its snapshot written back.
+        changed = []
+        with self._lock:
+            snapshots = self._snapshots
+            for (idx, entry), current in zip(watches, currents):
+                if idx in snapshots and current != snapshots[idx]:
+                    snapshots[idx] = current
+                    changed.append((idx, entry))
+
+        for idx, entry in changed:
             try:
-                current = self._client.get(entry.pattern)
-            except (KeyError, Exception):
-                current = None
-
-            prev = self._snapshots.get(idx)
-            if current != prev:
-                with self._lock:
-                    self._snapshots[idx] = current
-                try:
-                    result = entry.callback()
-                    fired.append({"index": idx, "pattern": entry.pattern, "result": result})
-                except Exception as exc:
-                    fired.append({"index": idx, "pattern": entry.pattern, "error": str(exc)})
+                result = entry.callback()
+                fired.append({"index": idx, "pattern": entry.pattern, "result": result})
+            except Exception as exc:
+                fired.append({"index": idx, "pattern": entry.pattern, "error": str(exc)})
 
         return fired
+
+    def _fetch(self, patterns: List[str]) -> List[Any]:
+        """Current value of each pattern, None where it could not be read.
+
+        A CmxClient reads every pattern in one round trip; other clients
+        are asked one ``get`` at a time.
+        """
+        client = self._client
+        if isinstance(client, CmxClient) and len(patterns) > 1:
+            try:
+                responses = client.bulk(
+                    [{"command": "ns.get", "path": p} for p in patterns]
+                )
+            except Exception:
+                # Unread responses may still be in flight; reconnect on the
+                # next poll so they are never matched to the wrong patterns
+                client.close()
+                return [None] * len(patterns)
+            return [
+                None if resp.get("status") == "error" else resp.get("output")
+                for resp in responses
+            ]
+
+        currents = []
+        for pattern in patterns:
+            try:
+                currents.append(client.get(pattern))
+            except (KeyError, Exception):
+                currents.append(None)
+        return currents
@@ -110,3 +110,76 @@ class TestContextManager:
             assert c is client
             mock_conn.connect.assert_called_once()
         mock_conn.close.assert_called_once()
+
+
+class TestBulk:
+    def test_bulk_sends_all_commands_at_once(self):
+        """bulk() hands every command to send_many in one call."""
+        client = CmxClient.__new__(CmxClient)
+        mock_conn = MagicMock()
+        mock_conn.send_many.return_value = [
+            _make_response("ok", output="a"),
+            _make_response("ok", output=""),
+        ]
+        client._conn = mock_conn
+
+        cmds = [
+            {"command": "ns.get", "path": "x"},
+            {"command": "ns.set", "path": "y", "value": 1},
+        ]
+        result = client.bulk(cmds)
+        assert result[0]["output"] == "a"
+        mock_conn.send_many.assert_called_once_with(cmds)
+        mock_conn.send.assert_not_called()
+
+
+class TestPipeline:
+    def _client(self, responses):
+        client = CmxClient.__new__(CmxClient)
+        mock_conn = MagicMock()
+        mock_conn.send_many.return_value = responses
+        client._conn = mock_conn
+        return client
+
+    def test_pipeline_resolves_on_exit(self):
+        """Queued commands are sent together when the block exits."""
+        client = self._client([
+            _make_response("ok", output="running"),
+            _make_response("ok", output=""),
+            _make_response("ok", output="a.b\na.c"),
+        ])
+        with client.pipeline() as p:
+            status = p.get("agent.w1.status")
+            done = p.set("task.t1.status", "complete")
+            names = p.keys("a.*")
+            assert not status.done()
+
+        client._conn.send_many.assert_called_once_with([
+            {"command": "ns.get", "path": "agent.w1.status"},
+            {"command": "ns.set", "path": "task.t1.status", "value": "complete"},
+            {"command": "ns.keys", "pattern": "a.*"},
+        ])
+        assert status.result() == "running"
+        assert done.result() is None
+        assert names.result() == ["a.b", "a.c"]
+
+    def test_pipeline_error_raised_per_result(self):
+        """An error response raises only from its own result."""
+        client = self._client([
+            _make_response("error", message="path not found: x"),
+            _make_response("ok", output="1"),
+        ])
+        with client.pipeline() as p:
+            missing = p.get("x")
+            present = p.get("y")
+
+        with pytest.raises(KeyError, match="not found"):
+            missing.result()
+        assert present.result() == "1"
+
+    def test_result_before_execute_raises(self):
+        client = self._client([])
+        p = client.pipeline()
+        pending = p.get("x")
+        with pytest.raises(RuntimeError, match="not been executed"):
+            pending.result()
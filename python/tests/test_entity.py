@@ -239,3 +239,61 @@ def test_split_name_title_no_separator():
     name, title = _split_name_title("JustAName")
     assert name == "JustAName"
     assert title == "JustAName"
+
+
+def test_entity_fields_parsed_lazily():
+    """KV parsing is deferred until fields/status/type are read."""
+    fm = DocketFrontmatter(docket_type="task")
+    body = "## T1 — Auth\nType:: bug\nStatus:: pending\nAssignee:: alice\n"
+    trees = parse_outline(body, fm, StatusMap.default_map())
+    entity = trees[0].entity
+    assert entity._pending is not None
+    assert entity.name == "T1"
+    assert entity._pending is not None
+
+    assert entity.status == "pending"
+    assert entity._pending is None
+    assert entity.entity_type == "bug"
+    assert entity.fields == {"Assignee": "alice"}
+    assert entity.kv_format == KvFormat.COLONS
+
+
+def test_entity_eager_constructor_still_supported():
+    e = Entity(name="X", title="Y", fields={"a": "1"}, status="complete")
+    assert e.fields == {"a": "1"}
+    assert e.status == "complete"
+    assert e == Entity(name="X", title="Y", fields={"a": "1"}, status="complete")
+
+
+def test_lazy_entity_is_still_a_dataclass():
+    """replace/asdict/fields and match see parsed values on a lazy entity."""
+    import dataclasses
+
+    fm = DocketFrontmatter(docket_type="task")
+    body = "## T1 — Auth\nType:: bug\nAssignee:: alice\n"
+    entity = parse_outline(body, fm, StatusMap.default_map())[0].entity
+    assert dataclasses.is_dataclass(entity)
+    assert [f.name for f in dataclasses.fields(entity)][:4] == [
+        "name", "title", "entity_type", "status",
+    ]
+    assert entity._pending is not None
+
+    copy = dataclasses.replace(entity, name="T2")
+    assert copy.entity_type == "bug"
+    assert copy.fields == {"Assignee": "alice"}
+    assert dataclasses.asdict(entity)["fields"] == {"Assignee": "alice"}
+    assert Entity.__match_args__[:2] == ("name", "title")
+
+
+def test_declared_format_skips_detection():
+    """A docket-format in the frontmatter is used instead of sniffing the body."""
+    fm = DocketFrontmatter(docket_type="task", docket_format="kv-packed")
+    body = "## T1 — Auth\nOwner:: bob\n:: assignee:alice\n"
+    entity = parse_outline(body, fm, StatusMap.default_map())[0].entity
+    assert entity.kv_format == KvFormat.PACKED
+    assert entity.fields == {"assignee": "alice"}
+
+    undeclared = DocketFrontmatter(docket_type="task")
+    body = "## T1 — Auth\n| Field | Value |\n|---|---|\n| Owner | bob |\n"
+    entity = parse_outline(body, undeclared, StatusMap.default_map())[0].entity
+    assert entity.kv_format == KvFormat.TABLE
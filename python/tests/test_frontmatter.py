@@ -1,5 +1,7 @@
 """Tests for cmx.docket.frontmatter -- frontmatter detection, parsing, scanning."""
 
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
@@ -43,6 +45,15 @@ def test_parse_docket_yaml_ignores_non_docket():
     assert parse_frontmatter(content) is None
 
 
+def test_parse_docket_yaml_prefilter_keeps_escaped_keys():
+    """Foreign YAML is rejected unparsed; escaped docket keys still count."""
+    # An invalid date would make the YAML loader raise if it ran
+    assert parse_frontmatter("---\ndate: 2024-13-45\n---\nbody\n") is None
+    result = parse_frontmatter('---\n"docket\\x2dtype": task\n---\nbody\n')
+    assert result is not None
+    assert result[0].docket_type == "task"
+
+
 def test_parse_file_with_docket_markers():
     """Matches Rust test: parse_file_with_docket_markers."""
     content = "---\ndocket-type: task\ndocket-layout: outline\n---\n# Roadmap\n## AUTH \u2014 Login\n"
@@ -148,3 +159,210 @@ def test_scan_directory_recurses_into_subdirs():
 
         files = scan_directory(d)
         assert len(files) == 2
+
+
+def test_scan_directory_reuses_unchanged_parse():
+    """Unchanged files are served from the scan cache; edits are picked up."""
+    from cmx.docket.frontmatter import clear_scan_cache
+
+    clear_scan_cache()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        d = Path(tmpdir)
+        path = d / "roadmap.md"
+        path.write_text("---\ndocket-type: task\n---\n# Roadmap\n")
+
+        first = scan_directory(d)
+        second = scan_directory(d)
+        # Served from the cache (same body string), as a fresh copy
+        assert second[0] == first[0]
+        assert second[0].body is first[0].body
+        assert second[0] is not first[0]
+
+        # Callers own what they get; mutating it does not reach the cache
+        second[0].frontmatter.docket_type = "x"
+        assert scan_directory(d)[0].frontmatter.docket_type == "task"
+
+        path.write_text("---\ndocket-type: spec\n---\n# Roadmap v2\n")
+        third = scan_directory(d)
+        assert third[0].frontmatter.docket_type == "spec"
+    clear_scan_cache()
+
+
+def test_fast_scalar_yaml_handles_simple_headers():
+    """Plain key: value headers skip PyYAML; anything richer falls back."""
+    from cmx.docket._yaml import fast_scalar_yaml
+
+    assert fast_scalar_yaml("docket-type: task\ndocket-layout: outline") == {
+        "docket-type": "task",
+        "docket-layout": "outline",
+    }
+    assert fast_scalar_yaml("docket-type: yes") is None
+    assert fast_scalar_yaml("docket-status:\n  complete: [DONE]") is None
+    assert fast_scalar_yaml("docket-format: '{kv-table}'") is None
+
+
+def test_parse_docket_status_map_via_yaml_fallback():
+    content = (
+        "---\ndocket-type: task\ndocket-status:\n"
+        "  complete: [DONE, OK]\n---\nbody\n"
+    )
+    fm, _, _ = parse_frontmatter(content)
+    assert fm.docket_type == "task"
+    assert fm.docket_status == {"complete": ["DONE", "OK"]}
+
+
+def test_fast_flow_map_yaml_handles_status_maps():
+    """docket-status flow-list maps skip PyYAML; anything richer falls back."""
+    from cmx.docket._yaml import fast_flow_map_yaml
+
+    assert fast_flow_map_yaml(
+        'docket-type: task\ndocket-status:\n  complete: ["\u2705", "[x]", DONE]\n  pending: []'
+    ) == {
+        "docket-type": "task",
+        "docket-status": {"complete": ["\u2705", "[x]", "DONE"], "pending": []},
+    }
+    assert fast_flow_map_yaml("docket-status:\n  complete: [yes]") is None
+    assert fast_flow_map_yaml("docket-status:\n  complete: [DONE]\n    failed: [F]") is None
+    assert fast_flow_map_yaml('docket-status:\n  complete: ["\\u2705"]') is None
+    assert fast_flow_map_yaml("docket-type: task\n  complete: [DONE]") is None
+
+
+def test_scan_directory_parallel_reads_keep_order():
+    """Large scans read files on a pool but return them in scan order."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        d = Path(tmpdir)
+        sub = d / "sub"
+        sub.mkdir()
+        for i in range(20):
+            (d / f"f{i:02d}.md").write_text(f"---\ndocket-type: t{i}\n---\n# F{i}\n")
+        (sub / "a.md").write_text("---\ndocket-type: sub\n---\n# A\n")
+
+        files = scan_directory(d)
+        names = [f.path.name for f in files]
+        assert names == [f"f{i:02d}.md" for i in range(20)] + ["a.md"]
+        assert files[3].frontmatter.docket_type == "t3"
+
+
+def test_scan_directory_decodes_plain_file_once_inherited():
+    """A plain file skipped without decoding is re-read once a marker appears."""
+    from cmx.docket.frontmatter import _parse_cache, clear_scan_cache
+
+    clear_scan_cache()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        d = Path(tmpdir)
+        plain = d / "auth.md"
+        plain.write_text("# AUTH — Login\r\nStatus:: pending\r\n")
+
+        assert scan_directory(d) == []
+        assert _parse_cache[str(plain)][3] is None
+
+        (d / ".docket-folder.md").write_text(
+            "---\ndocket-type: task\ndocket-layout: folder\n---\n"
+        )
+        files = scan_directory(d)
+        assert len(files) == 1
+        assert files[0].body == "# AUTH — Login\nStatus:: pending\n"
+    clear_scan_cache()
+
+
+def test_scan_directory_large_files_beyond_peek():
+    """Docket files larger than the peek window are read in full."""
+    from cmx.docket.frontmatter import clear_scan_cache
+
+    clear_scan_cache()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        d = Path(tmpdir)
+        filler = "x" * 10000 + "\n"
+        (d / "big.md").write_text("---\ndocket-type: task\n---\n" + filler + "# End\n")
+        (d / "plain.md").write_text(filler * 2)
+        (d / "late.md").write_text(" " * 5000 + "---\ndocket-type: late\n---\nbody\n")
+
+        files = {f.path.name: f for f in scan_directory(d)}
+        assert set(files) == {"big.md", "late.md"}
+        assert files["big.md"].body.endswith("# End\n")
+    clear_scan_cache()
+
+
+def test_scan_directory_skips_foreign_frontmatter_from_peek():
+    """Non-docket frontmatter is rejected without decoding the body."""
+    from cmx.docket.frontmatter import _parse_cache, clear_scan_cache
+
+    clear_scan_cache()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        d = Path(tmpdir)
+        post = d / "post.md"
+        post.write_text("---\r\ntitle: Hello\r\n---\r\n" + "text\n" * 2000)
+        (d / "task.md").write_text("---\ndocket-type: task\n---\n## T1 — One\n")
+
+        files = scan_directory(d)
+        assert [f.path.name for f in files] == ["task.md"]
+        assert _parse_cache[str(post)][3] is None
+
+        (d / ".docket-folder.md").write_text("---\ndocket-type: task\n---\n")
+        files = {f.path.name: f for f in scan_directory(d)}
+        assert files["post.md"].body == "text\n" * 2000
+    clear_scan_cache()
+
+
+def test_scan_cache_prunes_unvisited_files(monkeypatch):
+    """An oversized scan cache keeps only the files the latest scan visited."""
+    from cmx.docket import frontmatter
+
+    frontmatter.clear_scan_cache()
+    monkeypatch.setattr(frontmatter, "_SCAN_CACHE_SIZE", 2)
+    with tempfile.TemporaryDirectory() as a, tempfile.TemporaryDirectory() as b:
+        for d in (Path(a), Path(b)):
+            for name in ("x.md", "y.md"):
+                (d / name).write_text("---\ndocket-type: task\n---\n")
+
+        scan_directory(Path(a))
+        scan_directory(Path(b))
+        assert set(frontmatter._parse_cache) == {str(Path(b) / "x.md"), str(Path(b) / "y.md")}
+    frontmatter.clear_scan_cache()
+
+
+def test_simple_frontmatter_does_not_import_pyyaml():
+    """PyYAML is imported only when a document needs the full loader."""
+    code = (
+        "import sys\n"
+        "from cmx.docket import parse_frontmatter\n"
+        "assert parse_frontmatter('---\\ndocket-type: task\\n---\\n') is not None\n"
+        "assert 'yaml' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parent.parent)
+
+
+def test_concurrent_scans_prune_safely(monkeypatch):
+    """Scans in several threads can fill and prune the shared cache."""
+    import threading
+
+    from cmx.docket import frontmatter
+    from cmx.docket.frontmatter import clear_scan_cache
+
+    # Every scan prunes what the other threads' scans cached
+    monkeypatch.setattr(frontmatter, "_SCAN_CACHE_SIZE", 0)
+    clear_scan_cache()
+    errors = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dirs = []
+        for i in range(4):
+            d = Path(tmpdir) / f"d{i}"
+            d.mkdir()
+            for j in range(40):
+                (d / f"f{j}.md").write_text("---\ndocket-type: task\n---\nbody\n")
+            dirs.append(d)
+
+        def scan(d):
+            try:
+                for _ in range(20):
+                    assert len(scan_directory(d)) == 40
+            except Exception as exc:  # surfaced below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=scan, args=(d,)) for d in dirs]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    clear_scan_cache()
+    assert errors == []
@@ -112,6 +112,11 @@ def test_detect_frontmatter_format():
     assert detect_format(body) == KvFormat.FRONTMATTER
 
 
+def test_detect_format_returns_declared_hint():
+    body = "Status:: pending\nAssignee:: nobody\n"
+    assert detect_format(body, KvFormat.TABLE) == KvFormat.TABLE
+
+
 # --- serialization round-trip tests ---
 
 def test_colons_round_trip():
@@ -1,8 +1,11 @@
 """Tests for cmx.docket.merge -- multi-file merge, provenance, write-back."""
 
+import os
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from cmx.docket.kv import KvFormat
 from cmx.docket.merge import MergeStore
 from cmx.docket.status import StatusMap
@@ -260,3 +263,127 @@ def test_update_file_content_preserves_non_kv_body():
     assert "This is the body text that should be preserved." in updated
     assert "Assignee:: worker2" in updated
     assert "\u2705 AUTH1" in updated
+
+
+def test_load_file_reuses_parse_for_unchanged_file():
+    """Reloading identical content reuses the cached parse; edits re-parse."""
+    store = MergeStore()
+    path = Path("/tmp/cached-roadmap.md")
+    content = "---\ndocket-type: task\n---\n## T1 — One\nOwner:: a\n"
+
+    store.load_string(path, content)
+    first = store._parse_cache[path][3]
+    store.load_string(path, content)
+    assert store._parse_cache[path][3] is first
+
+    store.load_string(path, content.replace("Owner:: a", "Owner:: b"))
+    assert store._parse_cache[path][3] is not first
+    assert store.get("T1").fields["Owner"] == "b"
+
+
+def test_write_back_skips_unchanged_files():
+    """A write-back that changes nothing leaves the file alone."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        target = Path(tmpdir) / "roadmap.md"
+        target.write_text(
+            "---\ndocket-type: task\n---\n## AUTH1 — Login\nAssignee:: worker1\n"
+        )
+        store = MergeStore()
+        store.load_directory(Path(tmpdir))
+
+        assert store.write_back() == []
+
+        store.set_field("AUTH1", "Assignee", "worker2")
+        assert store.write_back() == [target]
+        assert "Assignee:: worker2" in target.read_text()
+        assert store.write_back() == []
+
+
+def test_write_back_only_touches_files_with_changed_entities():
+    """Files whose entities were never set are not rewritten."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        d = Path(tmpdir)
+        changed = d / "a.md"
+        untouched = d / "b.md"
+        changed.write_text("---\ndocket-type: task\n---\n## A1 — One\nOwner:: a\n")
+        # CRLF line endings would be normalized by a rewrite
+        untouched_bytes = b"---\r\ndocket-type: task\r\n---\r\n## B1 \xe2\x80\x94 Two\r\nOwner:: b\r\n"
+        untouched.write_bytes(untouched_bytes)
+        store = MergeStore()
+        store.load_directory(d)
+
+        store.set_field("A1", "Owner", "c")
+        assert store.write_back() == [changed]
+        assert untouched.read_bytes() == untouched_bytes
+
+
+def test_mark_dirty_writes_back_direct_edits():
+    """Entities edited directly are written once marked dirty."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        target = Path(tmpdir) / "roadmap.md"
+        target.write_text("---\ndocket-type: task\n---\n## AUTH1 — Login\nAssignee:: worker1\n")
+        store = MergeStore()
+        store.load_directory(Path(tmpdir))
+
+        store.get("AUTH1").fields["Assignee"] = "worker2"
+        assert store.write_back() == []
+
+        store.mark_dirty("AUTH1")
+        assert store.write_back() == [target]
+        assert "Assignee:: worker2" in target.read_text()
+
+        with pytest.raises(KeyError):
+            store.mark_dirty("NOPE")
+
+
+def test_write_back_keeps_changes_pending_after_failure(monkeypatch):
+    """A write-back that raises can be retried without losing edits."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        target = Path(tmpdir) / "roadmap.md"
+        target.write_text("---\ndocket-type: task\n---\n## AUTH1 — Login\nAssignee:: worker1\n")
+        store = MergeStore()
+        store.load_directory(Path(tmpdir))
+        store.set_field("AUTH1", "Assignee", "worker2")
+
+        def failing_write(self, data):
+            raise OSError("disk full")
+
+        with monkeypatch.context() as m:
+            m.setattr(Path, "write_bytes", failing_write)
+            with pytest.raises(OSError):
+                store.write_back()
+
+        assert store.write_back() == [target]
+        assert "Assignee:: worker2" in target.read_text()
+
+
+def test_load_directory_uses_scan_mtime():
+    """Provenance times come from the scan's stat, not a second stat."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        target = Path(tmpdir) / "roadmap.md"
+        target.write_text("---\ndocket-type: task\n---\n## T1 — One\nOwner:: a\n")
+        os.utime(target, ns=(1_700_000_000_123_000_000, 1_700_000_000_123_000_000))
+
+        store = MergeStore()
+        store.load_directory(Path(tmpdir))
+
+        assert store.get("T1").field_sources["Owner"].modified_ms == 1_700_000_000_123
+
+
+def test_set_field_does_not_touch_sibling_sources():
+    """Fields read from one file share a source; set_field replaces only its own."""
+    store = MergeStore()
+    content = "---\ndocket-type: task\n---\n## T1 — One\nOwner:: a\nPriority:: high\n"
+    store.load_string(Path("/tmp/shared-source.md"), content)
+    entity = store.get("T1")
+    before = entity.field_sources["Priority"].modified_ms
+
+    store.set_field("T1", "Owner", "b")
+
+    assert entity.field_sources["Priority"].modified_ms == before
+    assert entity.field_sources["Owner"].path == Path("/tmp/shared-source.md")
+    assert entity.field_sources["Owner"] is not entity.field_sources["Priority"]
+
+    # The shared source cannot be edited in place for one field
+    with pytest.raises(AttributeError):
+        entity.field_sources["Priority"].modified_ms = 0
@@ -71,3 +71,216 @@ class TestRoundTrip:
         encoded = encode_request(cmd)
         decoded = decode_response(encoded)
         assert decoded == cmd
+
+
+class TestSendMany:
+    def test_send_many_single_write_ordered_responses(self):
+        """All frames go out in one buffer and responses come back in order."""
+        import socket
+        from cmx.protocol import SocketConnection
+
+        client_sock, server_sock = socket.socketpair()
+        try:
+            conn = SocketConnection("/unused")
+            conn._sock = client_sock
+
+            cmds = [{"command": "ns.get", "path": f"p{i}"} for i in range(3)]
+            for i in range(3):
+                payload = json.dumps({"status": "ok", "output": i}).encode()
+                server_sock.sendall(struct.pack('>I', len(payload)) + payload)
+
+            responses = conn.send_many(cmds)
+            assert [r["output"] for r in responses] == [0, 1, 2]
+
+            received = server_sock.recv(65536)
+            expected = b"".join(encode_request(c) for c in cmds)
+            assert received == expected
+        finally:
+            client_sock.close()
+            server_sock.close()
+
+    def test_send_many_failure_drops_unread_responses(self):
+        """A batch that fails mid-read closes the connection, so its
+        remaining frames are never returned for a later request."""
+        import socket
+        from cmx.protocol import SocketConnection
+
+        client_sock, server_sock = socket.socketpair()
+        try:
+            conn = SocketConnection("/unused")
+            conn._sock = client_sock
+
+            bad = b"{not json"
+            good = json.dumps({"output": "v2"}).encode()
+            server_sock.sendall(
+                struct.pack('>I', len(bad)) + bad + struct.pack('>I', len(good)) + good
+            )
+            with pytest.raises(ValueError):
+                conn.send_many([{"c": 1}, {"c": 2}])
+            assert conn._sock is None
+            assert len(conn._rbuf) == 0
+        finally:
+            client_sock.close()
+            server_sock.close()
+
+    def test_send_many_empty(self):
+        from cmx.protocol import SocketConnection
+        assert SocketConnection("/unused").send_many([]) == []
+
+
+class TestPersistentConnection:
+    def test_reconnects_once_when_socket_is_stale(self, tmp_path):
+        """A write on a dead socket reconnects and resends the request."""
+        import socket
+        from cmx.protocol import SocketConnection
+
+        path = str(tmp_path / "cmx.sock")
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen(1)
+
+        stale, peer = socket.socketpair()
+        peer.close()
+        conn = SocketConnection(path)
+        conn._sock = stale
+        try:
+            payload = json.dumps({"status": "ok", "output": "fresh"}).encode()
+            cmd = {"command": "ns.get", "path": "a"}
+            # Queue the reply on the accepted side before the client reads.
+            conn._write(encode_request(cmd))
+            accepted, _ = server.accept()
+            accepted.sendall(struct.pack('>I', len(payload)) + payload)
+            assert conn._read_frame() == {"status": "ok", "output": "fresh"}
+            assert conn._sock is not stale
+            accepted.close()
+        finally:
+            conn.close()
+            server.close()
+
+    def test_partly_sent_batch_is_not_resent(self, monkeypatch):
+        """Once part of a batch went out, a write error is raised, not retried."""
+        from cmx.protocol import SocketConnection
+
+        class PartialSock:
+            """Accepts the first buffer it is handed, then fails."""
+
+            def __init__(self):
+                self.accepted = []
+
+            def _take(self, first):
+                if self.accepted:
+                    raise BrokenPipeError("peer went away")
+                self.accepted.append(bytes(first))
+                return len(first)
+
+            def sendmsg(self, views):
+                return self._take(views[0])
+
+            def send(self, view):
+                return self._take(view[: len(view) // 2])
+
+            def close(self):
+                pass
+
+        conn = SocketConnection("/unused")
+        reconnects = []
+        monkeypatch.setattr(conn, "connect", lambda: reconnects.append(True))
+
+        # Scatter-gather: the first frame is fully sent before the error
+        conn._sock = PartialSock()
+        with pytest.raises(BrokenPipeError):
+            conn._write(encode_request({"c": 1}), encode_request({"c": 2}))
+
+        # Joined send_many batch: half the buffer is sent before the error
+        conn._sock = PartialSock()
+        with pytest.raises(BrokenPipeError):
+            conn.send_many([{"c": 1}, {"c": 2}])
+
+        assert reconnects == []
+        assert conn._sock is None
+
+    def test_buffered_reads_split_frames(self):
+        """Frames arriving in one chunk are served from the read buffer."""
+        import socket
+        from cmx.protocol import SocketConnection
+
+        client_sock, server_sock = socket.socketpair()
+        try:
+            conn = SocketConnection("/unused")
+            conn._sock = client_sock
+            frames = b""
+            for i in range(5):
+                payload = json.dumps({"n": i}).encode()
+                frames += struct.pack('>I', len(payload)) + payload
+            server_sock.sendall(frames)
+            assert [conn._read_frame()["n"] for _ in range(5)] == list(range(5))
+            assert len(conn._rbuf) == 0
+        finally:
+            client_sock.close()
+            server_sock.close()
+
+    def test_large_request_sent_scatter_gather(self):
+        """A large request reaches the peer byte-identical to encode_request."""
+        import socket
+        import threading
+        from cmx.protocol import SCATTER_MIN_PAYLOAD, SocketConnection
+
+        client_sock, server_sock = socket.socketpair()
+        try:
+            conn = SocketConnection("/unused")
+            conn._sock = client_sock
+            cmd = {"command": "ns.set", "path": "a", "value": "x" * (SCATTER_MIN_PAYLOAD * 4)}
+            expected = encode_request(cmd)
+            received = bytearray()
+
+            def serve():
+                while len(received) < len(expected):
+                    received.extend(server_sock.recv(1 << 20))
+                reply = json.dumps({"status": "ok"}).encode()
+                server_sock.sendall(struct.pack('>I', len(reply)) + reply)
+
+            server = threading.Thread(target=serve)
+            server.start()
+            assert conn.send(cmd) == {"status": "ok"}
+            server.join()
+            assert bytes(received) == expected
+        finally:
+            client_sock.close()
+            server_sock.close()
+
+    def test_large_frame_received_directly(self):
+        """A frame larger than the read chunk is reassembled intact."""
+        import socket
+        import threading
+        from cmx.protocol import RECV_CHUNK_SIZE, SocketConnection
+
+        client_sock, server_sock = socket.socketpair()
+        try:
+            conn = SocketConnection("/unused")
+            conn._sock = client_sock
+            big = {"value": "x" * (RECV_CHUNK_SIZE * 3)}
+            payload = json.dumps(big).encode()
+            small = json.dumps({"n": 1}).encode()
+            data = (struct.pack('>I', len(payload)) + payload
+                    + struct.pack('>I', len(small)) + small)
+            sender = threading.Thread(target=server_sock.sendall, args=(data,))
+            sender.start()
+            assert conn._read_frame() == big
+            assert conn._read_frame() == {"n": 1}
+            sender.join()
+        finally:
+            client_sock.close()
+            server_sock.close()
+
+
+class TestJsonBackend:
+    def test_dumps_handles_non_string_keys(self):
+        """Payloads orjson rejects still encode via the stdlib fallback."""
+        from cmx.protocol import _dumps, _loads
+        assert _loads(_dumps({"value": {1: "a"}})) == {"value": {"1": "a"}}
+
+    def test_dumps_is_compact_utf8_json(self):
+        from cmx.protocol import _dumps, _loads
+        data = _dumps({"v": "café"})
+        assert isinstance(data, bytes)
+        assert _loads(data) == {"v": "café"}
@@ -1,5 +1,9 @@
 """Tests for cmx.docket.status -- StatusMap."""
 
+import sys
+
+import pytest
+
 from cmx.docket.status import StatusMap
 
 
@@ -45,6 +49,16 @@ def test_custom_status_map():
     assert m.write_form("todo") == "NO"
 
 
+def test_custom_status_map_interns_canonical_names():
+    """Lookups return one shared object per canonical status."""
+    # Built at runtime, so the key is not a compile-time interned constant
+    raw = {"".join(["do", "ne"]): ["OK", "YES"]}
+    m = StatusMap.from_raw(raw)
+    assert m.canonicalize("OK") is m.canonicalize("YES")
+    assert m.canonicalize("OK") is sys.intern("done")
+    assert m.match_prefix("OK go")[0] is m.canonicalize("OK")
+
+
 def test_unknown_representation_returns_none():
     m = StatusMap.default_map()
     assert m.canonicalize("UNKNOWN") is None
@@ -53,3 +67,62 @@ def test_unknown_representation_returns_none():
 def test_unknown_canonical_write_form_returns_none():
     m = StatusMap.default_map()
     assert m.write_form("nonexistent") is None
+
+
+def test_match_prefix_default_map():
+    m = StatusMap.default_map()
+    assert m.match_prefix("[x] T1 — Done") == ("complete", "[x]", 3)
+    assert m.match_prefix("\U0001f504 T2") == ("in_progress", "\U0001f504", 1)
+    assert m.match_prefix("T3 — plain") is None
+
+
+def test_match_prefix_first_listed_wins():
+    """Overlapping representations resolve in forward order."""
+    m = StatusMap.from_raw({"short": ["OK"], "long": ["OKAY"]})
+    assert m.match_prefix("OKAY x") == ("short", "OK", 2)
+
+
+def test_match_prefix_empty_map():
+    assert StatusMap.from_raw({}).match_prefix("[x] a") is None
+
+
+def test_default_map_is_shared_and_read_only():
+    m = StatusMap.default_map()
+    assert StatusMap.default_map() is m
+    with pytest.raises(TypeError):
+        m.reverse["DONE"] = "pending"
+    with pytest.raises(TypeError):
+        m.forward["complete"] = ("OK",)
+    # The representation lists are frozen too, not just the outer dicts
+    with pytest.raises(AttributeError):
+        m.forward["complete"].append("OK")
+    assert m.forward["complete"] == ("\u2705", "[x]", "DONE")
+    # ...and the mappings themselves cannot be swapped out
+    with pytest.raises(AttributeError):
+        m.forward = {"complete": ["OK"]}
+    with pytest.raises(AttributeError):
+        m.reverse = {"OK": "complete"}
+    with pytest.raises(AttributeError):
+        del m.forward
+    assert m.write_form("complete") == "\u2705"
+    assert m.canonicalize("DONE") == "complete"
+
+
+def test_derived_lookups_follow_forward_edits():
+    """forward stays a plain dict of lists; lookups track edits to it."""
+    raw = {"done": ["OK"]}
+    m = StatusMap.from_raw(raw)
+    assert m.forward == {"done": ["OK"]}
+
+    m.forward["done"].insert(0, "YES")
+    assert m.write_form("done") == "YES"
+    assert m.match_prefix("YES a") == ("done", "YES", 3)
+
+    m.forward["todo"] = ["[ ]"]
+    assert m.write_form("todo") == "[ ]"
+    assert m.match_prefix("[ ] a") == ("todo", "[ ]", 3)
+
+    # Assigning a new mapping rebuilds them too
+    m.forward = {"done": ["OK"]}
+    assert m.write_form("todo") is None
+    assert m.match_prefix("[ ] a") is None
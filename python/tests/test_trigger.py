@@ -155,3 +155,15 @@ def test_parse_context_lte():
     assert cond.kind == "context"
     assert cond.op == CompareOp.LTE
     assert cond.percent == 50
+
+
+def test_parse_triggers_reuses_frozen_blocks():
+    """Re-parsing the same text returns the same frozen blocks."""
+    text = 'if idle({agent}, 30)\n    then cmx tell pm "{agent} idle"\n'
+    first = parse_triggers(text)
+    second = parse_triggers(text)
+    assert first == second
+    assert first is not second
+    assert first[0] is second[0]
+    with pytest.raises(AttributeError):
+        first[0].clauses[0].action.command_template = "changed"
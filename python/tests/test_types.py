@@ -2,6 +2,8 @@
 
 import json
 
+import pytest
+
 from cmx.docket.types import TaskNode, TaskSource, TaskStatus
 
 
@@ -69,3 +71,118 @@ def test_task_status_all_values():
     assert TaskStatus.FAILED.value == "failed"
     assert TaskStatus.PAUSED.value == "paused"
     assert TaskStatus.CANCELLED.value == "cancelled"
+
+
+def test_task_node_json_keeps_non_ascii():
+    """Like serde_json, non-ASCII text is not escaped."""
+    task = TaskNode(
+        id="T1",
+        title="Café — ✅",
+        source=TaskSource.ROADMAP,
+        status=TaskStatus.PENDING,
+    )
+    json_str = task.to_json()
+    assert "Café — ✅" in json_str
+    assert TaskNode.from_json(json_str) == task
+
+
+def test_task_node_to_json_matches_to_dict():
+    """to_json emits exactly the to_dict() tree, in the same key order."""
+    task = TaskNode(
+        id="T1",
+        title="Parent",
+        source=TaskSource.BOTH,
+        status=TaskStatus.FAILED,
+        result="boom",
+        children=[
+            TaskNode(id="T1.1", title="Child", source=TaskSource.ROADMAP,
+                     status=TaskStatus.PENDING, spec_path="spec.md"),
+        ],
+    )
+    assert task.to_json() == json.dumps(task.to_dict(), separators=(",", ":"))
+
+
+def _chain(depth):
+    """A root with one child per level, ``depth`` levels below it."""
+    root = TaskNode(id="0", title="n", source=TaskSource.ROADMAP, status=TaskStatus.PENDING)
+    node = root
+    for i in range(1, depth + 1):
+        child = TaskNode(id=str(i), title="n", source=TaskSource.ROADMAP, status=TaskStatus.PENDING)
+        node.children.append(child)
+        node = child
+    return root
+
+
+def test_task_node_round_trip_deep_tree():
+    """to_dict/from_dict and to_json/from_json handle trees deeper than the
+    recursion limit (and orjson's nesting limit)."""
+    import sys
+
+    depth = sys.getrecursionlimit() + 99
+    root = _chain(depth)
+    for back in (TaskNode.from_dict(root.to_dict()),
+                 TaskNode.from_json(root.to_json())):
+        levels = 0
+        while back.children:
+            back = back.children[0]
+            levels += 1
+        assert levels == depth
+        assert back.id == str(depth)
+
+
+def test_task_node_to_json_deep_tree():
+    """to_json writes trees deeper than the recursion limit, same text as json."""
+    from cmx.docket.types import _dumps_deep
+
+    root = _chain(5000)
+    json_str = root.to_json()
+    assert json_str.startswith('{"id":"0","title":"n","source":"roadmap"')
+    assert json_str.count('"id":') == 5001
+    shallow = _chain(3)
+    assert _dumps_deep(shallow) == json.dumps(
+        shallow.to_dict(), separators=(",", ":"), ensure_ascii=False
+    )
+
+
+def test_task_node_to_json_orjson_matches_stdlib():
+    """The orjson and stdlib encoders produce byte-identical JSON."""
+    pytest.importorskip("orjson")
+    task = TaskNode(
+        id="T1",
+        title='Tab\tquote" back\\slash \x01 Café — ✅',
+        source=TaskSource.BOTH,
+        status=TaskStatus.IN_PROGRESS,
+        agent="w1",
+        children=[
+            TaskNode(id="T1.1", title="\u2028 line", source=TaskSource.ROADMAP,
+                     status=TaskStatus.PENDING, result="\x7f", spec_path="s.md"),
+        ],
+    )
+    assert task.to_json() == json.dumps(
+        task.to_dict(), separators=(",", ":"), ensure_ascii=False
+    )
+
+
+def test_task_node_to_dict_flat_is_preorder():
+    """to_dict_flat lists nodes in pre-order with parent row indexes."""
+    task = TaskNode(
+        id="T1", title="Root", source=TaskSource.ROADMAP, status=TaskStatus.PENDING,
+        children=[
+            TaskNode(id="T1.1", title="A", source=TaskSource.ROADMAP,
+                     status=TaskStatus.COMPLETED, agent="w1",
+                     children=[
+                         TaskNode(id="T1.1.1", title="A1", source=TaskSource.BOTH,
+                                  status=TaskStatus.FAILED, result="boom"),
+                     ]),
+            TaskNode(id="T1.2", title="B", source=TaskSource.FILESYSTEM,
+                     status=TaskStatus.PAUSED, spec_path="b.md"),
+        ],
+    )
+    flat = task.to_dict_flat()
+    assert flat["id"] == ["T1", "T1.1", "T1.1.1", "T1.2"]
+    assert flat["parent"] == [-1, 0, 1, 0]
+    assert flat["status"] == ["pending", "completed", "failed", "paused"]
+    assert flat["source"] == ["roadmap", "roadmap", "both", "filesystem"]
+    assert flat["agent"] == [None, "w1", None, None]
+    assert flat["result"] == [None, None, "boom", None]
+    assert flat["spec_path"] == [None, None, None, "b.md"]
@@ -2,9 +2,22 @@
 
 import pytest
 from unittest.mock import MagicMock
+from cmx.client import CmxClient
 from cmx.watch import WatchManager, WatchEntry
 
 
+class StubClient:
+    """Client double that serves fixed values, without mock call tracking."""
+
+    __slots__ = ("_kv",)
+
+    def __init__(self, kv=None):
+        self._kv = kv or {}
+
+    def get(self, path):
+        return self._kv.get(path)
+
+
 class TestWatchRegistration:
     def test_watch_registers_callback(self):
         """Register a watch, verify entry stored."""
@@ -26,7 +39,13 @@ class TestWatchRegistration:
         mgr = WatchManager(mock_client)
 
         idx = mgr.watch("task.$t.agent.$a.status", lambda: None)
-        assert mgr._watches[idx].variables == ['t', 'a']
+        assert mgr._watches[idx].variables == ('t', 'a')
+
+    def test_watch_entry_has_no_instance_dict(self):
+        """Entries use slots and keep variables as an immutable tuple."""
+        entry = WatchEntry("task.$t", lambda: None, ['t'])
+        assert not hasattr(entry, '__dict__')
+        assert entry.variables == ('t',)
 
     def test_multiple_watches(self):
         """Multiple watches get sequential indices."""
@@ -53,10 +72,7 @@ class TestWatchRegistration:
 
     def test_poll_once_fires_on_change(self):
         """poll_once fires callback when value changes."""
-        mock_client = MagicMock()
-        mock_client.get.return_value = "new_value"
-
-        mgr = WatchManager(mock_client)
+        mgr = WatchManager(StubClient({"task.t1.status": "new_value"}))
         results = []
         mgr.watch("task.t1.status", lambda: results.append("fired"))
 
@@ -66,10 +82,7 @@ class TestWatchRegistration:
 
     def test_poll_once_no_fire_same_value(self):
         """poll_once does not fire when value is unchanged."""
-        mock_client = MagicMock()
-        mock_client.get.return_value = "same"
-
-        mgr = WatchManager(mock_client)
+        mgr = WatchManager(StubClient({"task.t1.status": "same"}))
         mgr.watch("task.t1.status", lambda: None)
 
         # First poll: fires because prev is None, current is "same"
@@ -77,3 +90,118 @@ class TestWatchRegistration:
         # Second poll: should not fire because value unchanged
         fired = mgr.poll_once()
         assert len(fired) == 0
+
+    def test_poll_once_skips_unwatched(self):
+        """Unwatched entries are not polled."""
+        mock_client = MagicMock()
+        mock_client.get.return_value = "v"
+
+        mgr = WatchManager(mock_client)
+        idx = mgr.watch("a.b", lambda: None)
+        mgr.watch("c.d", lambda: None)
+        mgr.unwatch(idx)
+
+        fired = mgr.poll_once()
+        assert [f["pattern"] for f in fired] == ["c.d"]
+        mock_client.get.assert_called_once_with("c.d")
+
+    def test_unwatch_from_callback_leaves_no_snapshot(self):
+        """A watch removed by an earlier callback in the same poll stays removed."""
+        mgr = WatchManager(StubClient({"a.b": 1, "c.d": 2}))
+        second = None
+        mgr.watch("a.b", lambda: mgr.unwatch(second))
+        second = mgr.watch("c.d", lambda: None)
+
+        mgr.poll_once()
+        assert second not in mgr._snapshots
+        assert second not in mgr._active
+
+    def test_poll_once_batches_cmx_client_reads(self, monkeypatch):
+        """A CmxClient is read once per poll through bulk()."""
+        client = CmxClient("/nonexistent/cmx.sock")
+        batches = []
+
+        def fake_bulk(commands):
+            batches.append([c["path"] for c in commands])
+            return [
+                {"status": "ok", "output": "done"},
+                {"status": "error", "message": "Path not found"},
+            ]
+
+        monkeypatch.setattr(client, "bulk", fake_bulk)
+        monkeypatch.setattr(client, "get", MagicMock(side_effect=AssertionError))
+
+        mgr = WatchManager(client)
+        mgr.watch("task.t1.status", lambda: "t1")
+        mgr.watch("task.t2.status", lambda: "t2")
+
+        fired = mgr.poll_once()
+        assert batches == [["task.t1.status", "task.t2.status"]]
+        # The missing path reads as None, same as the initial snapshot
+        assert [f["result"] for f in fired] == ["t1"]
+
+    def test_failed_bulk_read_resets_connection(self, monkeypatch):
+        """A failed batch closes the client so stale responses are dropped."""
+        client = CmxClient("/nonexistent/cmx.sock")
+
+        def failing_bulk(commands):
+            raise ConnectionError("Socket closed before all data received")
+
+        closed = []
+        monkeypatch.setattr(client, "bulk", failing_bulk)
+        monkeypatch.setattr(client, "close", lambda: closed.append(True))
+
+        mgr = WatchManager(client)
+        mgr.watch("task.t1.status", lambda: None)
+        mgr.watch("task.t2.status", lambda: None)
+
+        assert mgr.poll_once() == []
+        assert closed == [True]
+
+    def test_poll_loop_backs_off_while_unchanged(self, monkeypatch):
+        """Quiet polls stretch the delay up to the cap; a change resets it."""
+        mock_client = MagicMock()
+        values = iter(["a", "a", "a", "a", "b", "b"])
+        mock_client.get.side_effect = lambda path: next(values)
+
+        mgr = WatchManager(mock_client)
+        mgr.watch("task.t1.status", lambda: None)
+
+        delays = []
+
+        def fake_wait(seconds):
+            delays.append(seconds)
+            return len(delays) == 6
+
+        monkeypatch.setattr(mgr._stop_event, "wait", fake_wait)
+        mgr._running = True
+        mgr._poll_loop(1.0, 2.0)
+
+        assert delays == [1.0, 1.5, 2.0, 2.0, 1.0, 1.5]
+
+    def test_start_polls_steadily_unless_backoff_requested(self, monkeypatch):
+        """Backoff is opt-in: by default the delay stays at poll_interval."""
+        mgr = WatchManager(StubClient({}))
+        calls = []
+        monkeypatch.setattr(mgr, "_poll_loop", lambda *args: calls.append(args))
+
+        mgr.start(poll_interval=0.25)
+        mgr.stop()
+        mgr.start(poll_interval=0.25, max_interval=4.0)
+        mgr.stop()
+
+        assert calls == [(0.25, 0.25), (0.25, 4.0)]
+
+    def test_stop_wakes_sleeping_poll_loop(self):
+        """stop() returns promptly even with a long poll interval."""
+        import time
+
+        mgr = WatchManager(StubClient({"a.b": "v"}))
+        mgr.watch("a.b", lambda: None)
+
+        mgr.start(poll_interval=60.0)
+        thread = mgr._poll_thread
+        started = time.monotonic()
+        mgr.stop()
+        assert time.monotonic() - started < 2.0
+        assert not thread.is_alive()